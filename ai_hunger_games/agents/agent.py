@@ -5,6 +5,7 @@ manages personality, memory, and response generation interface.
 Actual LLM calls are deferred to Phase 1+ implementation.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
@@ -16,7 +17,7 @@ from ai_hunger_games.core.logging_setup import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundContext:
     """Context provided to agent for response generation.
     
@@ -52,9 +53,14 @@ class Agent:
         if not agent_id:
             raise ValueError("Agent ID cannot be empty")
         
-        self._agent_id = agent_id
+        # Interned so the many agent-keyed dicts compare ids by identity
+        self._agent_id = sys.intern(agent_id)
         self._personality = personality
         self._memory = AgentMemory(window_size=memory_window)
+        self._stub_prefix = f"[Agent {self._agent_id}]"
+        self._stub_suffix = (
+            f"(Personality: {personality.communication_style.value})"
+        )
         
         logger.info(
             f"Created agent '{agent_id}' with personality: "
@@ -89,8 +95,9 @@ class Agent:
             The agent's response to the prompt.
         """
         logger.debug(
-            f"Agent '{self._agent_id}' generating response for round "
-            f"{context.round_number}"
+            "Agent '%s' generating response for round %d",
+            self._agent_id,
+            context.round_number
         )
         
         response = self._generate_stub_response(context)
@@ -116,7 +123,6 @@ class Agent:
             A placeholder response string.
         """
         return (
-            f"[Agent {self._agent_id}] Response to round {context.round_number}: "
-            f"'{context.prompt[:50]}...' "
-            f"(Personality: {self._personality.communication_style.value})"
+            f"{self._stub_prefix} Response to round {context.round_number}: "
+            f"'{context.prompt[:50]}...' {self._stub_suffix}"
         )
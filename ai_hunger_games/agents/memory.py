@@ -4,11 +4,12 @@ Agents have read-only access to their own history via a sliding window.
 Memory includes previous answers, votes cast, and aggregate voting outcomes.
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteCounts:
     """Aggregate voting outcomes for a round (counts only, no identities).
     
@@ -19,8 +20,18 @@ class VoteCounts:
     votes_received: int
 
 
-@dataclass(frozen=True)
-class MemoryEntry:
+class _HashCache:
+    """Slot storage for a lazily computed hash.
+    
+    Declared on a base class so the cache is not a dataclass field and
+    stays out of fields(), asdict() and equality.
+    """
+    
+    __slots__ = ("_hash",)
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryEntry(_HashCache):
     """A single memory entry representing one round's activity.
     
     Contains the agent's own response and vote, plus aggregate outcomes.
@@ -32,6 +43,21 @@ class MemoryEntry:
     response: str
     vote_cast: Optional[str] = None  # agent_id voted for, None if no vote yet
     vote_counts: Optional[VoteCounts] = None  # aggregate outcomes
+    
+    def __hash__(self) -> int:
+        """Return the hash, computing it once; entries are immutable."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((
+                self.round_number,
+                self.prompt,
+                self.response,
+                self.vote_cast,
+                self.vote_counts,
+            ))
+            object.__setattr__(self, "_hash", value)
+            return value
 
 
 class AgentMemory:
@@ -39,7 +65,8 @@ class AgentMemory:
     
     Maintains a fixed-size window of recent round entries.
     Memory is append-only during a run; old entries are dropped
-    when the window size is exceeded.
+    when the window size is exceeded. Backed by a bounded deque so
+    dropping the oldest entry is O(1) instead of a list re-slice.
     """
     
     def __init__(self, window_size: int = 5) -> None:
@@ -52,7 +79,7 @@ class AgentMemory:
             raise ValueError("Memory window size must be at least 1")
         
         self._window_size = window_size
-        self._entries: list[MemoryEntry] = []
+        self._entries: deque[MemoryEntry] = deque(maxlen=window_size)
     
     @property
     def window_size(self) -> int:
@@ -62,13 +89,13 @@ class AgentMemory:
     def add_entry(self, entry: MemoryEntry) -> None:
         """Add a new memory entry, dropping oldest if window exceeded.
         
+        The bounded deque evicts the oldest entry itself, so no
+        per-round copy of the window is made.
+        
         Args:
             entry: The memory entry to add.
         """
         self._entries.append(entry)
-        
-        if len(self._entries) > self._window_size:
-            self._entries = self._entries[-self._window_size:]
     
     def get_entries(self) -> list[MemoryEntry]:
         """Get all entries in the memory window.
@@ -98,4 +125,4 @@ class AgentMemory:
     
     def clear(self) -> None:
         """Clear all memory entries."""
-        self._entries = []
+        self._entries.clear()
@@ -41,13 +41,25 @@ class RiskTolerance(Enum):
     HIGH = "high"
 
 
-@dataclass(frozen=True)
-class Personality:
+class _PersonalityCache:
+    """Slot storage for Personality's computed forms.
+    
+    Declared on a base class so the caches are not dataclass fields and
+    never appear in fields(), asdict() or the event log serializer.
+    """
+    
+    __slots__ = ("_dict", "_description", "_hash")
+
+
+@dataclass(frozen=True, slots=True)
+class Personality(_PersonalityCache):
     """Immutable personality definition for an agent.
     
     Personality is defined by 4 categorical traits that influence
     how the agent generates responses and makes voting decisions.
     The seed is used for reproducibility in personality generation.
+    Hash, dictionary and description forms are computed on first use
+    and kept, since the instance can never change afterwards.
     """
     
     communication_style: CommunicationStyle
@@ -56,19 +68,70 @@ class Personality:
     risk_tolerance: RiskTolerance
     seed: int
     
+    def __hash__(self) -> int:
+        """Return the hash, computing it on first use.
+        
+        Personalities are used as dict/set keys, so the field walk is
+        done once instead of on every lookup. Computed lazily because
+        copies and unpickled instances skip __init__.
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((
+                self.communication_style,
+                self.ethical_stance,
+                self.social_strategy,
+                self.risk_tolerance,
+                self.seed,
+            ))
+            object.__setattr__(self, "_hash", value)
+            return value
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare traits and seed, rejecting on the cached hash first.
+        
+        Replacement checks mostly compare differing personalities, which
+        a single int comparison settles without walking the fields.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        return (
+            self.communication_style,
+            self.ethical_stance,
+            self.social_strategy,
+            self.risk_tolerance,
+            self.seed,
+        ) == (
+            other.communication_style,
+            other.ethical_stance,
+            other.social_strategy,
+            other.risk_tolerance,
+            other.seed,
+        )
+    
     def to_dict(self) -> dict[str, str]:
         """Convert personality to dictionary for logging/serialization.
         
+        Returns a shallow copy so callers cannot mutate the cached form.
+        
         Returns:
             Dictionary with trait names and their values.
         """
-        return {
-            "communication_style": self.communication_style.value,
-            "ethical_stance": self.ethical_stance.value,
-            "social_strategy": self.social_strategy.value,
-            "risk_tolerance": self.risk_tolerance.value,
-            "seed": str(self.seed),
-        }
+        try:
+            cached = self._dict
+        except AttributeError:
+            cached = {
+                "communication_style": self.communication_style.value,
+                "ethical_stance": self.ethical_stance.value,
+                "social_strategy": self.social_strategy.value,
+                "risk_tolerance": self.risk_tolerance.value,
+                "seed": str(self.seed),
+            }
+            object.__setattr__(self, "_dict", cached)
+        return dict(cached)
     
     def describe(self) -> str:
         """Generate a human-readable description of the personality.
@@ -76,9 +139,14 @@ class Personality:
         Returns:
             String description of personality traits.
         """
-        return (
-            f"Communication: {self.communication_style.value}, "
-            f"Ethics: {self.ethical_stance.value}, "
-            f"Strategy: {self.social_strategy.value}, "
-            f"Risk: {self.risk_tolerance.value}"
-        )
+        try:
+            return self._description
+        except AttributeError:
+            description = (
+                f"Communication: {self.communication_style.value}, "
+                f"Ethics: {self.ethical_stance.value}, "
+                f"Strategy: {self.social_strategy.value}, "
+                f"Risk: {self.risk_tolerance.value}"
+            )
+            object.__setattr__(self, "_description", description)
+            return description
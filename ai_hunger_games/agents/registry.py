@@ -4,7 +4,7 @@ The registry provides a central place to track and access all agents.
 It enforces unique agent IDs and provides lookup functionality.
 """
 
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from ai_hunger_games.agents.agent import Agent
 from ai_hunger_games.core.logging_setup import get_logger
@@ -53,6 +53,30 @@ class AgentRegistry:
         self._agents[agent.agent_id] = agent
         logger.info(f"Registered agent '{agent.agent_id}' in registry")
     
+    def register_many(self, agents: Iterable[Agent]) -> None:
+        """Register several agents at once, all or none.
+        
+        Duplicates are checked for the whole batch before anything is
+        inserted, so a rejected batch leaves the registry unchanged.
+        
+        Args:
+            agents: The agents to register, in registration order.
+        
+        Raises:
+            DuplicateAgentError: If any ID repeats within the batch or
+                is already registered.
+        """
+        batch: dict[str, Agent] = {}
+        for agent in agents:
+            if agent.agent_id in batch or agent.agent_id in self._agents:
+                raise DuplicateAgentError(
+                    f"Agent with ID '{agent.agent_id}' already registered"
+                )
+            batch[agent.agent_id] = agent
+        
+        self._agents.update(batch)
+        logger.info(f"Registered {len(batch)} agents in registry")
+    
     def get(self, agent_id: str) -> Agent:
         """Get an agent by ID.
         
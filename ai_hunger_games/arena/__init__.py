@@ -7,6 +7,7 @@ from ai_hunger_games.arena.controller import (
 from ai_hunger_games.arena.elimination import (
     EliminationCandidate,
     EliminationResult,
+    compute_tie_break_key,
     determine_elimination,
 )
 from ai_hunger_games.arena.round_state import AgentResponse, RoundState
@@ -18,5 +19,6 @@ __all__ = [
     "EliminationResult",
     "InsufficientAgentsError",
     "RoundState",
+    "compute_tie_break_key",
     "determine_elimination",
 ]
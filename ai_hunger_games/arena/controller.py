@@ -5,6 +5,10 @@ It manages round flow, calls agents in order, and collects responses.
 Voting and elimination logic will be added in Phase 2.
 """
 
+import logging
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ai_hunger_games.agents.agent import RoundContext
@@ -12,6 +16,7 @@ from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.arena.elimination import (
     EliminationCandidate,
     EliminationResult,
+    compute_tie_break_key,
     determine_elimination,
 )
 from ai_hunger_games.arena.round_state import RoundState
@@ -56,6 +61,7 @@ class ArenaController:
             settings: Configuration settings for the arena.
             replacement_coordinator: Optional coordinator for agent replacement.
             event_logger: Optional event logger for observability.
+                Closed by shutdown().
         """
         self._registry = registry
         self._settings = settings
@@ -63,11 +69,15 @@ class ArenaController:
         self._event_logger = event_logger
         self._current_round = 0
         self._round_history: list[RoundState] = []
+        self._round_by_number: dict[int, RoundState] = {}
         self._voting_history: list[VotingRoundResult] = []
-        self._cumulative_votes: dict[str, int] = {}
+        self._cumulative_votes: Counter[str] = Counter()
+        # Created on the first round so constructing a controller never
+        # starts threads; released by shutdown().
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         logger.info(
-            f"ArenaController initialized with {registry.count()} agents"
+            "ArenaController initialized with %d agents", registry.count()
         )
     
     @property
@@ -80,6 +90,15 @@ class ArenaController:
         """Get the number of active agents."""
         return self._registry.count()
     
+    @property
+    def cumulative_votes(self) -> dict[str, int]:
+        """Get cumulative votes received per agent.
+        
+        Returns a plain dict copy so callers cannot alter the running
+        tally that drives elimination.
+        """
+        return dict(self._cumulative_votes)
+    
     def start_round(self, prompt: str) -> RoundState:
         """Start a new round and collect responses from all agents.
         
@@ -92,18 +111,21 @@ class ArenaController:
         Raises:
             InsufficientAgentsError: If fewer than minimum agents exist.
         """
-        if self._registry.count() < self.MINIMUM_AGENTS:
+        agent_count = self._registry.count()
+        if agent_count < self.MINIMUM_AGENTS:
             raise InsufficientAgentsError(
                 f"Need at least {self.MINIMUM_AGENTS} agents, "
-                f"but only {self._registry.count()} registered"
+                f"but only {agent_count} registered"
             )
         
         self._current_round += 1
         
-        logger.info(
-            f"Starting round {self._current_round} with prompt: "
-            f"'{prompt[:50]}...'"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting round %d with prompt: '%s...'",
+                self._current_round,
+                prompt[:50]
+            )
         
         # Emit round started event
         if self._event_logger:
@@ -121,10 +143,12 @@ class ArenaController:
         
         round_state.is_complete = True
         self._round_history.append(round_state)
+        self._round_by_number[round_state.round_number] = round_state
         
         logger.info(
-            f"Round {self._current_round} complete with "
-            f"{round_state.response_count()} responses"
+            "Round %d complete with %d responses",
+            self._current_round,
+            round_state.response_count()
         )
         
         return round_state
@@ -132,6 +156,12 @@ class ArenaController:
     def _collect_responses(self, round_state: RoundState) -> RoundState:
         """Collect responses from all agents.
         
+        Agent calls are I/O-bound once backed by a model server, so they
+        run concurrently on the controller's thread pool. All responses
+        are gathered before any is recorded or logged, so a failing agent
+        never leaves a partially logged round, and events are emitted in
+        registration order to keep logs deterministic.
+        
         Args:
             round_state: The round state to populate.
         
@@ -143,19 +173,28 @@ class ArenaController:
             prompt=round_state.prompt
         )
         
-        for agent in self._registry:
-            logger.debug(f"Collecting response from agent '{agent.agent_id}'")
-            
-            response = agent.generate_response(context)
-            round_state.add_response(agent.agent_id, response)
-            
-            # Emit agent responded event
-            if self._event_logger:
-                self._event_logger.log_agent_responded(
-                    round_number=round_state.round_number,
-                    agent_id=agent.agent_id,
-                    response=response
-                )
+        agents = self._registry.get_all()
+        responses = list(self._get_executor().map(
+            lambda agent: agent.generate_response(context), agents
+        ))
+        
+        pairs = [
+            (agent.agent_id, response)
+            for agent, response in zip(agents, responses)
+        ]
+        round_state.extend_responses(pairs)
+        logger.debug(
+            "Collected %d responses for round %d",
+            len(pairs),
+            round_state.round_number
+        )
+        
+        # Emit agent responded events in one batch
+        if self._event_logger:
+            self._event_logger.log_agent_responded_bulk(
+                round_number=round_state.round_number,
+                responses=pairs
+            )
         
         return round_state
     
@@ -173,27 +212,29 @@ class ArenaController:
         Returns:
             Aggregated voting results.
         """
+        round_number = round_state.round_number
         votes = collect_votes(round_state, vote_choices)
         
-        # Emit individual vote events
+        # Emit individual vote events in one batch
         if self._event_logger:
-            for vote in votes:
-                self._event_logger.log_vote_cast(
-                    round_number=vote.round_number,
-                    voter_id=vote.voter_id,
-                    voted_for_id=vote.voted_for_id
-                )
+            self._event_logger.log_vote_cast_bulk(
+                round_number=round_number,
+                votes=[(vote.voter_id, vote.voted_for_id) for vote in votes]
+            )
         
-        agent_ids = [resp.agent_id for resp in round_state.responses]
-        result = aggregate_votes(votes, round_state.round_number, agent_ids)
+        result = aggregate_votes(
+            votes,
+            round_number,
+            (resp.agent_id for resp in round_state.responses)
+        )
         
-        # Emit vote summary event
+        # Emit vote summary event; counts are only built when logged
         if self._event_logger:
             vote_counts = {
                 vr.agent_id: vr.votes_received for vr in result.results
             }
             self._event_logger.log_vote_summary(
-                round_number=round_state.round_number,
+                round_number=round_number,
                 vote_counts=vote_counts
             )
         
@@ -201,8 +242,9 @@ class ArenaController:
         self._voting_history.append(result)
         
         logger.info(
-            f"Voting complete for round {round_state.round_number}: "
-            f"{len(votes)} votes cast"
+            "Voting complete for round %d: %d votes cast",
+            round_number,
+            len(votes)
         )
         
         return result
@@ -210,11 +252,8 @@ class ArenaController:
     def _update_cumulative_votes(self, result: VotingRoundResult) -> None:
         """Update cumulative vote counts."""
         for vote_result in result.results:
-            if vote_result.agent_id not in self._cumulative_votes:
-                self._cumulative_votes[vote_result.agent_id] = 0
-            self._cumulative_votes[vote_result.agent_id] += (
-                vote_result.votes_received
-            )
+            agent_id = sys.intern(vote_result.agent_id)
+            self._cumulative_votes[agent_id] += vote_result.votes_received
     
     def determine_elimination_candidate(
         self
@@ -244,8 +283,9 @@ class ArenaController:
             )
         
         logger.info(
-            f"Elimination determined: '{result.eliminated_agent_id}' "
-            f"with {result.cumulative_votes} votes"
+            "Elimination determined: '%s' with %d votes",
+            result.eliminated_agent_id,
+            result.cumulative_votes
         )
         
         return result
@@ -253,34 +293,36 @@ class ArenaController:
     def _build_elimination_candidates(
         self
     ) -> list[EliminationCandidate]:
-        """Build elimination candidates with scores."""
-        candidates = []
+        """Build elimination candidates with scores.
         
-        for agent_id in self._registry.get_ids():
-            cumulative = self._cumulative_votes.get(agent_id, 0)
-            avg = self._calculate_historical_average(agent_id)
-            
-            candidates.append(
-                EliminationCandidate(
-                    agent_id=agent_id,
-                    cumulative_votes=cumulative,
-                    historical_average=avg
-                )
+        Reads each agent's running total from the cumulative tally, so
+        building a candidate is O(1) regardless of how many rounds ran.
+        """
+        votes = self._cumulative_votes
+        seed = self._settings.random_seed
+        
+        return [
+            EliminationCandidate(
+                agent_id=agent.agent_id,
+                cumulative_votes=votes[agent.agent_id],
+                historical_average=self._calculate_historical_average(
+                    agent.agent_id
+                ),
+                tie_break_key=compute_tie_break_key(agent.agent_id, seed)
             )
-        
-        return candidates
+            for agent in self._registry
+        ]
     
     def _calculate_historical_average(self, agent_id: str) -> float:
-        """Calculate historical vote average for an agent."""
+        """Calculate historical vote average for an agent.
+        
+        The running cumulative tally already holds the sum of votes over
+        every voting round, so no pass over the history is needed.
+        """
         if not self._voting_history:
             return 0.0
         
-        total_votes = sum(
-            result.get_votes_for(agent_id)
-            for result in self._voting_history
-        )
-        
-        return total_votes / len(self._voting_history)
+        return self._cumulative_votes[agent_id] / len(self._voting_history)
     
     def execute_replacement(
         self,
@@ -330,10 +372,44 @@ class ArenaController:
             )
         
         logger.info(
-            f"Agent replacement executed for '{agent_id}' "
-            f"after {rounds_survived} rounds"
+            "Agent replacement executed for '%s' after %d rounds",
+            agent_id,
+            rounds_survived
         )
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the response-collection pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._settings.max_parallel_agents,
+                thread_name_prefix="arena-agent"
+            )
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Release the worker threads and close the event log.
+        
+        The controller owns the event logger's lifetime, so buffered
+        events are flushed and the file handle released here rather
+        than at interpreter teardown. Call once the arena run is
+        finished, or use the controller as a context manager. Safe to
+        call more than once; a later round would start a fresh pool and
+        reopen the log for appending.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._event_logger:
+            self._event_logger.close()
+    
+    def __enter__(self) -> "ArenaController":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - shuts down worker threads."""
+        self.shutdown()
+    
     def get_round_history(self) -> list[RoundState]:
         """Get the history of all completed rounds.
         
@@ -351,7 +427,4 @@ class ArenaController:
         Returns:
             The round state or None if not found.
         """
-        for round_state in self._round_history:
-            if round_state.round_number == round_number:
-                return round_state
-        return None
+        return self._round_by_number.get(round_number)
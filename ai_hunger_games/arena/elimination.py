@@ -5,23 +5,30 @@ Implements deterministic tie-breaking per ARCHITECTURE.md.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
+from ai_hunger_games.core.hashing import stable_hash
 from ai_hunger_games.voting.types import VotingRoundResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EliminationCandidate:
     """A candidate for elimination with their score.
     
     Score is cumulative votes received against the agent.
+    tie_break_key may be precomputed by the caller with
+    compute_tie_break_key(agent_id, seed) so the final tie-break is an
+    attribute read. A precomputed key already folds in the seed, so
+    determine_elimination uses it as-is.
     """
     
     agent_id: str
     cumulative_votes: int
     historical_average: float
+    tie_break_key: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EliminationResult:
     """Result of an elimination decision.
     
@@ -42,11 +49,15 @@ def determine_elimination(
     Elimination is based on highest cumulative votes received.
     Ties are broken deterministically by:
     1. Lowest historical vote average
-    2. If still tied, deterministic sort by agent_id XOR seed
+    2. If still tied, deterministic sort by stable agent_id hash XOR seed
+    
+    All three criteria form one lexicographic key, so the selection is
+    a single pass with no intermediate lists or sort.
     
     Args:
         candidates: List of all agents with cumulative scores.
-        seed: Random seed for deterministic tie-breaking.
+        seed: Random seed for deterministic tie-breaking. Only applied
+            to candidates without a precomputed tie_break_key.
     
     Returns:
         Elimination result with eliminated agent ID.
@@ -57,43 +68,69 @@ def determine_elimination(
     if not candidates:
         raise ValueError("Cannot determine elimination with no candidates")
     
-    max_votes = max(c.cumulative_votes for c in candidates)
-    tied = [c for c in candidates if c.cumulative_votes == max_votes]
-    
-    was_tie = len(tied) > 1
-    
-    if len(tied) == 1:
-        eliminated = tied[0]
-    else:
-        eliminated = _break_tie(tied, seed)
+    eliminated = min(
+        candidates,
+        key=lambda c: (
+            -c.cumulative_votes,
+            c.historical_average,
+            _tie_break_key(c, seed),
+        )
+    )
     
     return EliminationResult(
         eliminated_agent_id=eliminated.agent_id,
         cumulative_votes=eliminated.cumulative_votes,
-        was_tie=was_tie
+        was_tie=_has_tie(candidates, eliminated.cumulative_votes)
     )
 
 
-def _break_tie(
-    tied_candidates: list[EliminationCandidate],
-    seed: int
-) -> EliminationCandidate:
-    """Break tie deterministically using historical average then seed.
+def compute_tie_break_key(agent_id: str, seed: int) -> int:
+    """Compute the final tie-break key for an agent.
+    
+    Uses stable_hash of the agent ID rather than hash(), so a full tie
+    eliminates the same agent in every run with this seed, whatever
+    PYTHONHASHSEED is.
     
     Args:
-        tied_candidates: Candidates with same cumulative votes.
-        seed: Random seed for final tie-breaking.
+        agent_id: The candidate's agent ID.
+        seed: Random seed for deterministic tie-breaking.
     
     Returns:
-        The selected candidate for elimination.
+        A key that is stable across interpreter runs.
     """
-    min_avg = min(c.historical_average for c in tied_candidates)
-    avg_tied = [c for c in tied_candidates if c.historical_average == min_avg]
+    return stable_hash(agent_id) ^ seed
+
+
+def _tie_break_key(candidate: EliminationCandidate, seed: int) -> int:
+    """Get the final tie-break key, computing it if not precomputed.
     
-    if len(avg_tied) == 1:
-        return avg_tied[0]
+    A precomputed key was built with its own seed, so seed is ignored
+    for it rather than applied twice.
+    """
+    if candidate.tie_break_key is not None:
+        return candidate.tie_break_key
+    return compute_tie_break_key(candidate.agent_id, seed)
+
+
+def _has_tie(
+    candidates: list[EliminationCandidate],
+    max_votes: int
+) -> bool:
+    """Check whether more than one candidate has the top vote count.
+    
+    Stops scanning as soon as a second match is found.
     
-    return sorted(
-        avg_tied,
-        key=lambda c: hash(c.agent_id) ^ seed
-    )[0]
+    Args:
+        candidates: All elimination candidates.
+        max_votes: The highest cumulative vote count.
+    
+    Returns:
+        True if at least two candidates share max_votes.
+    """
+    matches = 0
+    for candidate in candidates:
+        if candidate.cumulative_votes == max_votes:
+            matches += 1
+            if matches == 2:
+                return True
+    return False
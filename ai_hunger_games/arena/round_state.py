@@ -4,10 +4,11 @@ Contains data structures representing round state and agent responses.
 These are shared between the arena controller and other modules.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable, KeysView
+from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
     """A single agent's response in a round.
     
@@ -24,21 +25,58 @@ class RoundState:
     
     Tracks the prompt, all responses, and completion status.
     This is a mutable dataclass as state evolves during the round.
+    responses is an immutable tuple, so add_response and
+    extend_responses are the only ways to add to it and the per-agent
+    lookup index cannot drift out of sync.
     """
     
     round_number: int
     prompt: str
-    responses: list[AgentResponse] = field(default_factory=list)
+    responses: tuple[AgentResponse, ...] = ()
     is_complete: bool = False
     
+    def __post_init__(self) -> None:
+        """Index responses passed to the constructor.
+        
+        The index is a plain attribute rather than a field, so fields()
+        and asdict() only see round data. It is built per instance, so
+        copies made with dataclasses.replace() never share it.
+        """
+        self.responses = tuple(self.responses)
+        self._by_id: dict[str, str] = {}
+        for item in self.responses:
+            self._by_id.setdefault(item.agent_id, item.response)
+    
     def add_response(self, agent_id: str, response: str) -> None:
         """Add an agent's response to this round.
         
+        Copies the response tuple; use extend_responses when adding a
+        whole round's responses at once.
+        
         Args:
             agent_id: The responding agent's ID.
             response: The agent's response text.
         """
-        self.responses.append(AgentResponse(agent_id=agent_id, response=response))
+        self.responses += (AgentResponse(agent_id=agent_id, response=response),)
+        self._by_id.setdefault(agent_id, response)
+    
+    def extend_responses(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add several agents' responses in one call.
+        
+        Equivalent to calling add_response for each pair in order.
+        
+        Args:
+            pairs: (agent_id, response) pairs.
+        """
+        new_responses = tuple(
+            AgentResponse(agent_id=agent_id, response=response)
+            for agent_id, response in pairs
+        )
+        self.responses += new_responses
+        
+        by_id = self._by_id
+        for item in new_responses:
+            by_id.setdefault(item.agent_id, item.response)
     
     def get_response(self, agent_id: str) -> str | None:
         """Get a specific agent's response.
@@ -49,10 +87,18 @@ class RoundState:
         Returns:
             The response text or None if not found.
         """
-        for resp in self.responses:
-            if resp.agent_id == agent_id:
-                return resp.response
-        return None
+        return self._by_id.get(agent_id)
+    
+    def agent_id_set(self) -> KeysView[str]:
+        """Get the IDs of agents that responded, as a set-like view.
+        
+        A live view over the per-agent index, so membership checks are
+        O(1) and it never needs rebuilding when responses are added.
+        
+        Returns:
+            Set-like view of responding agent IDs.
+        """
+        return self._by_id.keys()
     
     def response_count(self) -> int:
         """Get the number of responses collected.
@@ -10,10 +10,11 @@ from pathlib import Path
 
 from ai_hunger_games.core.config import ConfigError, load_config
 from ai_hunger_games.core.logging_setup import setup_logging, get_logger
-from ai_hunger_games.core.ollama_client import OllamaClient
+from ai_hunger_games.core.ollama_client import OllamaClient, OllamaModel
 
 
 DEFAULT_CONFIG_PATH = Path("config/settings.yaml")
+BYTES_TO_MB = 1 / (1024 * 1024)
 
 
 def main() -> int:
@@ -97,10 +98,7 @@ def _check_ollama(args: argparse.Namespace) -> int:
         
         models = client.list_models()
         if models:
-            print(f"\nAvailable models ({len(models)}):")
-            for model in models:
-                size_mb = model.size / (1024 * 1024)
-                print(f"  - {model.name} ({size_mb:.1f} MB)")
+            sys.stdout.write(_format_model_list(models))
         else:
             print("\nNo models found. Pull a model with: ollama pull llama3.1:8b")
         
@@ -118,5 +116,25 @@ def _check_ollama(args: argparse.Namespace) -> int:
     return 0
 
 
+def _format_model_list(models: tuple[OllamaModel, ...]) -> str:
+    """Format the available-models listing as one block of text.
+    
+    Built as a single string so large model catalogs are emitted with
+    one stdout write instead of one print per model.
+    
+    Args:
+        models: Models reported by Ollama.
+    
+    Returns:
+        The formatted listing, newline-terminated.
+    """
+    lines = [f"\nAvailable models ({len(models)}):"]
+    lines.extend(
+        f"  - {model.name} ({model.size * BYTES_TO_MB:.1f} MB)"
+        for model in models
+    )
+    return "\n".join(lines) + "\n"
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -10,6 +10,11 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -28,6 +33,7 @@ class Settings:
     random_seed: int
     log_level: str
     log_file: str
+    max_parallel_agents: int = 8
 
 
 class ConfigError(Exception):
@@ -36,12 +42,34 @@ class ConfigError(Exception):
     pass
 
 
+# Required config keys and their types, checked in this order.
+_REQUIRED_KEYS: dict[str, type] = {
+    "model_name": str,
+    "temperature": float,
+    "ollama_base_url": str,
+    "num_agents": int,
+    "rounds_per_elimination": int,
+    "memory_window": int,
+    "random_seed": int,
+    "log_level": str,
+    "log_file": str,
+}
+
+# Parsed settings keyed by (resolved path, mtime_ns, size); any edit to the
+# file changes the key, so stale settings are never returned.
+_CONFIG_CACHE: dict[tuple[str, int, int], Settings] = {}
+
+
 def load_config(
     config_path: Path,
     overrides: Optional[dict[str, str | int | float]] = None
 ) -> Settings:
     """Load configuration from YAML file with optional overrides.
     
+    Loads without overrides are cached per file version, since Settings
+    is immutable and repeated CLI/test loads would re-parse identical
+    YAML.
+    
     Args:
         config_path: Path to the YAML configuration file.
         overrides: Optional dictionary of CLI overrides to apply.
@@ -55,19 +83,50 @@ def load_config(
     if not config_path.exists():
         raise ConfigError(f"Configuration file not found: {config_path}")
     
-    raw_config = _load_yaml(config_path)
-    
     if overrides:
-        raw_config = _apply_overrides(raw_config, overrides)
+        return _from_mapping(_load_yaml(config_path), overrides)
+    
+    stat = config_path.stat()
+    cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
     
-    return _validate_and_build(raw_config)
+    if cache_key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[cache_key] = _from_mapping(_load_yaml(config_path))
+    
+    return _CONFIG_CACHE[cache_key]
+
+
+def _from_mapping(
+    config: dict,
+    overrides: Optional[dict[str, str | int | float]] = None
+) -> Settings:
+    """Build Settings from an already-parsed configuration mapping.
+    
+    Shared by the YAML path and by callers that hold the mapping in
+    memory, so validation never requires a YAML round trip. The
+    mapping is copied, never modified.
+    
+    Args:
+        config: Parsed configuration keys and values.
+        overrides: Optional dictionary of CLI overrides to apply.
+    
+    Returns:
+        Validated Settings instance.
+    
+    Raises:
+        ConfigError: If keys are missing or have invalid types.
+    """
+    return _validate_and_build(_apply_overrides(config, overrides or {}))
 
 
 def _load_yaml(config_path: Path) -> dict:
-    """Load and parse YAML configuration file."""
+    """Load and parse YAML configuration file.
+    
+    Uses the libyaml-backed safe loader when available; it accepts the
+    same documents as yaml.safe_load and parses several times faster.
+    """
     try:
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file: {e}") from e
     
@@ -91,19 +150,7 @@ def _apply_overrides(
 
 def _validate_and_build(config: dict) -> Settings:
     """Validate configuration and build Settings instance."""
-    required_keys = {
-        "model_name": str,
-        "temperature": float,
-        "ollama_base_url": str,
-        "num_agents": int,
-        "rounds_per_elimination": int,
-        "memory_window": int,
-        "random_seed": int,
-        "log_level": str,
-        "log_file": str,
-    }
-    
-    for key, expected_type in required_keys.items():
+    for key, expected_type in _REQUIRED_KEYS.items():
         if key not in config:
             raise ConfigError(f"Missing required config key: {key}")
         
@@ -117,6 +164,13 @@ def _validate_and_build(config: dict) -> Settings:
                     f"got {type(value).__name__}"
                 )
     
+    max_parallel_agents = config.get("max_parallel_agents", 8)
+    if not isinstance(max_parallel_agents, int) or max_parallel_agents < 1:
+        raise ConfigError(
+            "Invalid value for max_parallel_agents: "
+            "expected a positive int"
+        )
+    
     return Settings(
         model_name=config["model_name"],
         temperature=config["temperature"],
@@ -127,4 +181,5 @@ def _validate_and_build(config: dict) -> Settings:
         random_seed=config["random_seed"],
         log_level=config["log_level"],
         log_file=config["log_file"],
+        max_parallel_agents=max_parallel_agents,
     )
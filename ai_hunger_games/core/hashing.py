@@ -0,0 +1,25 @@
+"""Stable hashing for AI Hunger Games.
+
+Provides the one string hash used wherever a seeded result must be
+reproducible across interpreter runs.
+"""
+
+import hashlib
+
+
+def stable_hash(text: str) -> int:
+    """Hash a string identically across interpreter runs.
+    
+    Built-in hash() is salted per process (PYTHONHASHSEED), so anything
+    seeded from it, such as generated personalities or elimination
+    tie-breaks, would differ between runs of the same seed. All such
+    callers share this helper so their guarantees cannot drift apart.
+    
+    Args:
+        text: The string to hash.
+    
+    Returns:
+        An unsigned 64-bit integer derived from a blake2b digest.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -8,20 +8,31 @@ import logging
 import sys
 from pathlib import Path
 
+# (level, log_file) of the last successful setup; makes re-entry free.
+_CONFIGURED: tuple[str, str | None] | None = None
+
 
 def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
     """Configure logging for the arena.
     
     Sets up structured logging with timestamp, level, module, and message.
     Console output goes to stderr; file output captures full run history.
+    Repeated calls with the same arguments are no-ops, so defensive
+    re-entry does not reopen the log file or recreate handlers.
     
     Args:
         level: Log level string (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         log_file: Optional path to log file. Creates parent dirs if needed.
     """
-    log_level = _parse_log_level(level)
+    global _CONFIGURED
     
+    key = (level.upper(), log_file)
     root_logger = logging.getLogger("ai_hunger_games")
+    if _CONFIGURED == key and root_logger.handlers:
+        return
+    
+    log_level = _parse_log_level(level)
+    
     root_logger.setLevel(log_level)
     
     root_logger.handlers.clear()
@@ -34,6 +45,8 @@ def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
     if log_file:
         file_handler = _create_file_handler(log_file, log_level, formatter)
         root_logger.addHandler(file_handler)
+    
+    _CONFIGURED = key
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -4,7 +4,10 @@ Provides connectivity to local Ollama instance for health checks and model listi
 No model inference calls are made in Phase 0 - only connectivity verification.
 """
 
+import asyncio
+import time
 from dataclasses import dataclass
+from typing import Optional
 
 import httpx
 
@@ -20,7 +23,7 @@ class OllamaConnectionError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OllamaModel:
     """Represents an available Ollama model."""
     
@@ -28,6 +31,94 @@ class OllamaModel:
     size: int
 
 
+def _parse_models(data: dict) -> tuple[OllamaModel, ...]:
+    """Parse an /api/tags payload into OllamaModel instances."""
+    models = tuple(
+        OllamaModel(
+            name=model_data.get("name", "unknown"),
+            size=model_data.get("size", 0),
+        )
+        for model_data in data.get("models", ())
+    )
+    
+    logger.info(f"Found {len(models)} models in Ollama")
+    return models
+
+
+def _model_key(model_name: str) -> str:
+    """Normalize a model name the way Ollama resolves it.
+    
+    Ollama treats an untagged name such as "llama3.1" as
+    "llama3.1:latest", so cached listings must compare on the same
+    form /api/show answers for, or the two probe paths disagree.
+    """
+    if ":" in model_name.rpartition("/")[2]:
+        return model_name
+    return f"{model_name}:latest"
+
+
+def _connection_error(error: httpx.HTTPError) -> OllamaConnectionError:
+    """Map an /api/tags failure to the error both clients raise.
+    
+    Keeps the sync and async clients reporting the same messages for
+    the same failure.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return OllamaConnectionError(
+            f"Ollama returned error: {error.response.status_code}"
+        )
+    return OllamaConnectionError(f"Failed to connect to Ollama: {error}")
+
+
+def _reports_missing_model(response: httpx.Response) -> bool:
+    """Check whether an /api/show 404 means the model, not the route.
+    
+    Ollama answers an unknown model with an error such as
+    "model 'x' not found", while a server without /api/show answers a
+    bare "404 page not found", which says nothing about the model.
+    """
+    return response.status_code == 404 and "model" in response.text.lower()
+
+
+class _ModelListCache:
+    """TTL cache of one Ollama model listing and its name set.
+    
+    Shared by the sync and async clients so both reuse a listing for the
+    same time and match names the same way.
+    """
+    
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty cache.
+        
+        Args:
+            ttl: Seconds a stored listing stays fresh.
+        """
+        self._ttl = ttl
+        self._expires_at = 0.0
+        self._models: tuple[OllamaModel, ...] | None = None
+        self._names: frozenset[str] = frozenset()
+    
+    def get(self) -> tuple[OllamaModel, ...] | None:
+        """Return the stored listing, or None if missing or expired."""
+        if self._models is not None and time.monotonic() < self._expires_at:
+            return self._models
+        return None
+    
+    def store(self, models: tuple[OllamaModel, ...]) -> None:
+        """Store a freshly fetched listing."""
+        self._expires_at = time.monotonic() + self._ttl
+        self._models = models
+        self._names = frozenset(_model_key(m.name) for m in models)
+    
+    def invalidate(self) -> None:
+        """Drop the stored listing so the next lookup refetches it."""
+        self._models = None
+    
+    def contains(self, model_name: str) -> bool:
+        """Check a name against the last stored listing."""
+        return _model_key(model_name) in self._names
+
+
 class OllamaClient:
     """Client for interacting with local Ollama instance.
     
@@ -35,16 +126,41 @@ class OllamaClient:
     All Ollama interactions in the arena must go through this client.
     """
     
-    def __init__(self, base_url: str, timeout: float = 10.0) -> None:
+    # Keep idle connections alive between polling calls so repeated
+    # health checks and model listings reuse the socket.
+    CONNECTION_LIMITS = httpx.Limits(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=15.0,
+    )
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        models_ttl: float = 60.0,
+        client: Optional[httpx.Client] = None
+    ) -> None:
         """Initialize Ollama client.
         
         Args:
             base_url: Base URL of Ollama API (e.g., http://localhost:11434).
             timeout: Request timeout in seconds.
+            models_ttl: Seconds a fetched model list is reused before
+                /api/tags is queried again.
+            client: Optional preconfigured HTTP client. Its owner stays
+                responsible for closing it.
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+        self._models = _ModelListCache(models_ttl)
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(
+                timeout=timeout,
+                limits=self.CONNECTION_LIMITS,
+            )
+        self._client = client
     
     def health_check(self) -> bool:
         """Check if Ollama is running and reachable.
@@ -68,39 +184,40 @@ class OllamaClient:
             logger.error(f"Ollama connection failed: {e}")
             return False
     
-    def list_models(self) -> list[OllamaModel]:
+    def list_models(self) -> tuple[OllamaModel, ...]:
         """List available models in Ollama.
         
+        Results are cached for models_ttl seconds so repeated availability
+        checks skip the HTTP round trip and JSON parse.
+        
         Returns:
-            List of available OllamaModel instances.
+            Tuple of available OllamaModel instances. Immutable, so the
+            cached listing is returned without copying.
         
         Raises:
             OllamaConnectionError: If Ollama is not reachable.
         """
+        cached = self._models.get()
+        if cached is not None:
+            return cached
+        
+        models = self._fetch_models()
+        self._models.store(models)
+        return models
+    
+    def invalidate_models_cache(self) -> None:
+        """Drop the cached model list so the next call refetches it."""
+        self._models.invalidate()
+    
+    def _fetch_models(self) -> tuple[OllamaModel, ...]:
+        """Fetch and parse the model list from /api/tags."""
         try:
             response = self._client.get(f"{self._base_url}/api/tags")
             response.raise_for_status()
-        except httpx.RequestError as e:
-            raise OllamaConnectionError(
-                f"Failed to connect to Ollama: {e}"
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise OllamaConnectionError(
-                f"Ollama returned error: {e.response.status_code}"
-            ) from e
-        
-        data = response.json()
-        models = []
-        
-        for model_data in data.get("models", []):
-            model = OllamaModel(
-                name=model_data.get("name", "unknown"),
-                size=model_data.get("size", 0),
-            )
-            models.append(model)
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            raise _connection_error(e) from e
         
-        logger.info(f"Found {len(models)} models in Ollama")
-        return models
+        return _parse_models(response.json())
     
     def check_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available in Ollama.
@@ -112,8 +229,7 @@ class OllamaClient:
             True if model is available, False otherwise.
         """
         try:
-            models = self.list_models()
-            available = any(m.name == model_name for m in models)
+            available = self._probe_model(model_name)
             
             if available:
                 logger.info(f"Model '{model_name}' is available")
@@ -124,9 +240,40 @@ class OllamaClient:
         except OllamaConnectionError:
             return False
     
+    def _probe_model(self, model_name: str) -> bool:
+        """Resolve availability with the least data on the wire.
+        
+        A fresh cached listing answers without any request. Otherwise
+        /api/show is asked about the single model. Only a 200 or a 404
+        whose body names the missing model is trusted; older servers
+        without the route also answer 404 (or 405), so anything else
+        falls back to the full /api/tags listing. Listed names are compared via _model_key so untagged names
+        resolve to ":latest" exactly as /api/show resolves them.
+        """
+        if self._models.get() is not None:
+            return self._models.contains(model_name)
+        
+        try:
+            response = self._client.post(
+                f"{self._base_url}/api/show", json={"name": model_name}
+            )
+            if response.status_code == 200:
+                return True
+            if _reports_missing_model(response):
+                return False
+        except httpx.RequestError as e:
+            logger.warning(
+                f"Ollama /api/show failed for '{model_name}', "
+                f"falling back to model listing: {e}"
+            )
+        
+        self.list_models()
+        return self._models.contains(model_name)
+    
     def close(self) -> None:
-        """Close the HTTP client connection."""
-        self._client.close()
+        """Close the HTTP client connection, unless it was injected."""
+        if self._owns_client:
+            self._client.close()
     
     def __enter__(self) -> "OllamaClient":
         """Context manager entry."""
@@ -135,3 +282,137 @@ class OllamaClient:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - closes client."""
         self.close()
+
+
+class AsyncOllamaClient:
+    """Async counterpart of OllamaClient.
+    
+    Lets callers overlap Ollama round trips, e.g. probing several hosts
+    with asyncio.gather instead of waiting on each in turn.
+    """
+    
+    CONNECTION_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=15.0,
+    )
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        models_ttl: float = 60.0,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Initialize async Ollama client.
+        
+        Args:
+            base_url: Base URL of Ollama API (e.g., http://localhost:11434).
+            timeout: Request timeout in seconds.
+            models_ttl: Seconds a fetched model list is reused.
+            client: Optional preconfigured async HTTP client. Its owner
+                stays responsible for closing it.
+        """
+        self._base_url = base_url.rstrip("/")
+        self._models = _ModelListCache(models_ttl)
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=self.CONNECTION_LIMITS,
+            )
+        self._client = client
+    
+    async def health_check(self) -> bool:
+        """Check if Ollama is running and reachable.
+        
+        Returns:
+            True if Ollama responds successfully, False otherwise.
+        """
+        try:
+            response = await self._client.get(f"{self._base_url}/api/tags")
+        except httpx.RequestError as e:
+            logger.error(f"Ollama connection failed: {e}")
+            return False
+        
+        if response.status_code != 200:
+            logger.warning(
+                f"Ollama health check failed: status {response.status_code}"
+            )
+            return False
+        
+        logger.info("Ollama health check passed")
+        return True
+    
+    async def list_models(self) -> tuple[OllamaModel, ...]:
+        """List available models in Ollama, cached for models_ttl seconds.
+        
+        Returns:
+            Tuple of available OllamaModel instances. Immutable, so the
+            cached listing is returned without copying.
+        
+        Raises:
+            OllamaConnectionError: If Ollama is not reachable.
+        """
+        cached = self._models.get()
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self._client.get(f"{self._base_url}/api/tags")
+            response.raise_for_status()
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            raise _connection_error(e) from e
+        
+        models = _parse_models(response.json())
+        self._models.store(models)
+        return models
+    
+    def invalidate_models_cache(self) -> None:
+        """Drop the cached model list so the next call refetches it."""
+        self._models.invalidate()
+    
+    async def check_models_available(
+        self,
+        model_names: list[str]
+    ) -> dict[str, bool]:
+        """Check several models against a single model listing.
+        
+        Args:
+            model_names: Names of the models to check.
+        
+        Returns:
+            Mapping of model name to availability. All False if Ollama
+            is unreachable.
+        """
+        try:
+            await self.list_models()
+        except OllamaConnectionError:
+            return {name: False for name in model_names}
+        
+        return {name: self._models.contains(name) for name in model_names}
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client connection, unless it was injected."""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - closes client."""
+        await self.aclose()
+
+
+async def health_check_all(clients: list[AsyncOllamaClient]) -> list[bool]:
+    """Run health checks against several Ollama hosts concurrently.
+    
+    Args:
+        clients: Clients to probe.
+    
+    Returns:
+        Health results in the same order as clients.
+    """
+    return list(await asyncio.gather(*(c.health_check() for c in clients)))
@@ -15,6 +15,13 @@ from ai_hunger_games.agents.personality import (
     RiskTolerance,
     SocialStrategy,
 )
+from ai_hunger_games.core.hashing import stable_hash
+
+# Trait choices, materialized once instead of list(Enum) per generation
+_COMMUNICATION_STYLES = tuple(CommunicationStyle)
+_ETHICAL_STANCES = tuple(EthicalStance)
+_SOCIAL_STRATEGIES = tuple(SocialStrategy)
+_RISK_TOLERANCES = tuple(RiskTolerance)
 
 
 class PersonalityGenerator:
@@ -50,10 +57,10 @@ class PersonalityGenerator:
         rng = random.Random(seed)
         
         personality = Personality(
-            communication_style=rng.choice(list(CommunicationStyle)),
-            ethical_stance=rng.choice(list(EthicalStance)),
-            social_strategy=rng.choice(list(SocialStrategy)),
-            risk_tolerance=rng.choice(list(RiskTolerance)),
+            communication_style=rng.choice(_COMMUNICATION_STYLES),
+            ethical_stance=rng.choice(_ETHICAL_STANCES),
+            social_strategy=rng.choice(_SOCIAL_STRATEGIES),
+            risk_tolerance=rng.choice(_RISK_TOLERANCES),
             seed=seed
         )
         
@@ -61,6 +68,20 @@ class PersonalityGenerator:
         
         return personality
     
+    def generate_many(self, count: int) -> list[Personality]:
+        """Generate several personalities in one call.
+        
+        Each personality is produced exactly as by successive generate()
+        calls, so every one stays reproducible from its recorded seed.
+        
+        Args:
+            count: Number of personalities to generate.
+        
+        Returns:
+            The generated personalities in generation order.
+        """
+        return [self.generate() for _ in range(count)]
+    
     def _compute_seed(self, agent_id: Optional[str]) -> int:
         """Compute seed for personality generation.
         
@@ -73,6 +94,7 @@ class PersonalityGenerator:
         seed = self._base_seed + self._generation_count
         
         if agent_id:
-            seed ^= hash(agent_id)
+            seed ^= stable_hash(agent_id)
         
         return seed
+
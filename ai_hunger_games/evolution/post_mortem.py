@@ -10,8 +10,14 @@ from dataclasses import dataclass
 from ai_hunger_games.agents.personality import Personality
 
 
-@dataclass(frozen=True)
-class PostMortemRecord:
+class _RecordHashCache:
+    """Slot for PostMortemRecord's hash, kept off the dataclass fields."""
+    
+    __slots__ = ("_hash",)
+
+
+@dataclass(frozen=True, slots=True)
+class PostMortemRecord(_RecordHashCache):
     """Observational record of an eliminated agent.
     
     Captures metadata about the agent's performance for potential
@@ -26,6 +32,22 @@ class PostMortemRecord:
     elimination_round: int
     was_tie: bool
     
+    def __hash__(self) -> int:
+        """Return the hash, computing it once; records are immutable."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((
+                self.agent_id,
+                self.personality,
+                self.rounds_survived,
+                self.total_votes_received,
+                self.elimination_round,
+                self.was_tie,
+            ))
+            object.__setattr__(self, "_hash", value)
+            return value
+    
     def to_dict(self) -> dict[str, object]:
         """Convert post-mortem record to dictionary.
         
@@ -5,6 +5,8 @@ new personalities. Per ARCHITECTURE.md, this is evolution by
 elimination without parameter tuning.
 """
 
+from typing import Iterator
+
 from ai_hunger_games.agents.agent import Agent
 from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.core.logging_setup import get_logger
@@ -132,7 +134,20 @@ class AgentReplacementCoordinator:
     def get_post_mortem_records(self) -> list[PostMortemRecord]:
         """Get all post-mortem records.
         
+        Copies the record list; observers that only iterate should use
+        iter_post_mortem_records() instead.
+        
         Returns:
             List of all post-mortem records.
         """
         return list(self._post_mortem_records)
+    
+    def iter_post_mortem_records(self) -> Iterator[PostMortemRecord]:
+        """Iterate post-mortem records without copying them.
+        
+        Records are immutable, so no copy is needed to keep them safe.
+        
+        Returns:
+            Iterator over post-mortem records in replacement order.
+        """
+        return iter(self._post_mortem_records)
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundStartedEvent:
     """Event emitted when a round starts."""
     
@@ -17,7 +17,7 @@ class RoundStartedEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentRespondedEvent:
     """Event emitted when an agent responds."""
     
@@ -27,7 +27,7 @@ class AgentRespondedEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteCastEvent:
     """Event emitted when a vote is cast.
     
@@ -40,7 +40,7 @@ class VoteCastEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteSummaryEvent:
     """Event emitted with aggregated vote results."""
     
@@ -49,7 +49,7 @@ class VoteSummaryEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EliminationDecidedEvent:
     """Event emitted when elimination is decided."""
     
@@ -60,7 +60,7 @@ class EliminationDecidedEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentReplacedEvent:
     """Event emitted when an agent is replaced."""
     
@@ -71,7 +71,7 @@ class AgentReplacedEvent:
     timestamp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArenaInitializedEvent:
     """Event emitted when arena is initialized."""
     
@@ -4,10 +4,20 @@ Appends events to immutable JSON log files. Per scope, logs are
 append-only and must not be modified once written.
 """
 
+import functools
+import gzip
 import json
-from datetime import datetime
+import os
+import zlib
+from dataclasses import fields, is_dataclass
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 from ai_hunger_games.observability.events import (
     AgentReplacedEvent,
@@ -20,6 +30,31 @@ from ai_hunger_games.observability.events import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of an event class, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize event data as UTF-8 JSON.
+    
+    Uses orjson when installed; the output parses identically either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _line_prefix(event_type: str) -> bytes:
+    """Serialized '{"event_type": ..., "data": ' opener for a log line.
+    
+    Built once per event type so each line only serializes its data.
+    """
+    return f'{{"event_type": {json.dumps(event_type)}, "data": '.encode("utf-8")
+
+
 class EventLogger:
     """Logs structured events to append-only JSON file.
     
@@ -27,12 +62,34 @@ class EventLogger:
     deterministic replay.
     """
     
-    def __init__(self, log_file_path: str) -> None:
+    WRITE_BUFFER_SIZE = 1 << 16
+    
+    def __init__(
+        self,
+        log_file_path: str,
+        flush_every: int = 1,
+        fsync: bool = False
+    ) -> None:
         """Initialize the event logger.
         
+        The file is opened once on first write and kept open, so each
+        event costs a buffered write rather than an open/close pair.
+        Paths ending in .gz are written gzip-compressed; pair them with a
+        larger flush_every, since each flush ends a compression block.
+        
         Args:
             log_file_path: Path to JSON log file.
+            flush_every: Number of writes buffered before flushing. The
+                default flushes every write so readers always see it.
+            fsync: Also fsync on every flush, for strict durability.
         """
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        
+        self._flush_every = flush_every
+        self._fsync = fsync
+        self._pending_writes = 0
+        self._file: Optional[BinaryIO] = None
         self._log_file = Path(log_file_path)
         self._log_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -82,6 +139,29 @@ class EventLogger:
         )
         self._append_event("AgentResponded", event)
     
+    def log_agent_responded_bulk(
+        self,
+        round_number: int,
+        responses: list[tuple[str, str]]
+    ) -> None:
+        """Log all agent responses of a round with a single write.
+        
+        Args:
+            round_number: The round the responses belong to.
+            responses: (agent_id, response) pairs in emission order.
+        """
+        timestamp = self._timestamp()
+        events = [
+            AgentRespondedEvent(
+                round_number=round_number,
+                agent_id=agent_id,
+                response=response,
+                timestamp=timestamp
+            )
+            for agent_id, response in responses
+        ]
+        self._append_events("AgentResponded", events)
+    
     def log_vote_cast(
         self,
         round_number: int,
@@ -97,6 +177,29 @@ class EventLogger:
         )
         self._append_event("VoteCast", event)
     
+    def log_vote_cast_bulk(
+        self,
+        round_number: int,
+        votes: list[tuple[str, str]]
+    ) -> None:
+        """Log all votes of a round with a single write.
+        
+        Args:
+            round_number: The round the votes belong to.
+            votes: (voter_id, voted_for_id) pairs in emission order.
+        """
+        timestamp = self._timestamp()
+        events = [
+            VoteCastEvent(
+                round_number=round_number,
+                voter_id=voter_id,
+                voted_for_id=voted_for_id,
+                timestamp=timestamp
+            )
+            for voter_id, voted_for_id in votes
+        ]
+        self._append_events("VoteCast", events)
+    
     def log_vote_summary(
         self,
         round_number: int,
@@ -155,20 +258,94 @@ class EventLogger:
             event_type: Type of event for deserialization.
             event: Event data.
         """
-        log_entry = {
-            "event_type": event_type,
-            "data": self._to_dict(event)
-        }
+        self._append_events(event_type, [event])
+    
+    def _append_events(
+        self,
+        event_type: str,
+        events: list[Any]
+    ) -> None:
+        """Append events of one type to the log file in a single write.
+        
+        Args:
+            event_type: Type of event for deserialization.
+            events: Event data, in order.
+        """
+        if not events:
+            return
+        
+        prefix = _line_prefix(event_type)
+        lines = b"".join(
+            prefix + _dumps(self._to_dict(event)) + b"}\n"
+            for event in events
+        )
+        
+        if self._file is None:
+            self._file = self._open()
         
-        with self._log_file.open("a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        self._file.write(lines)
+        self._pending_writes += 1
+        if self._pending_writes >= self._flush_every:
+            self.flush()
+    
+    def _open(self) -> BinaryIO:
+        """Open the log for appending, compressed if the path says so."""
+        if self._log_file.suffix == ".gz":
+            return gzip.open(self._log_file, "ab")
+        return self._log_file.open("ab", buffering=self.WRITE_BUFFER_SIZE)
+    
+    def flush(self) -> None:
+        """Flush buffered events to disk.
+        
+        Gzip logs are flushed with Z_SYNC_FLUSH, which byte-aligns every
+        event written so far. If the process dies before close() writes
+        the gzip trailer, a reader still recovers all flushed events.
+        """
+        if self._file is None:
+            return
+        
+        if isinstance(self._file, gzip.GzipFile):
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._pending_writes = 0
+    
+    def close(self) -> None:
+        """Flush pending events and close the log file."""
+        if self._file is None:
+            return
+        
+        self.flush()
+        self._file.close()
+        self._file = None
+    
+    def __enter__(self) -> "EventLogger":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - closes the log file."""
+        self.close()
     
     def _to_dict(self, event: Any) -> dict[str, Any]:
-        """Convert event to dictionary."""
-        if hasattr(event, "__dict__"):
-            return {k: v for k, v in event.__dict__.items()}
+        """Convert event to dictionary.
+        
+        Reads dataclass fields rather than __dict__, which slotted event
+        classes do not have.
+        """
+        if is_dataclass(event):
+            return {
+                name: getattr(event, name)
+                for name in _field_names(type(event))
+            }
         return event
     
     def _timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        return datetime.utcnow().isoformat()
+        """Get current UTC timestamp in ISO format, millisecond precision.
+        
+        Uses the tz-aware clock; datetime.utcnow() is deprecated and its
+        naive result hid the zone from log readers.
+        """
+        return datetime.now(UTC).isoformat(timespec="milliseconds")
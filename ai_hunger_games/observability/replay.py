@@ -5,12 +5,27 @@ introducing new randomness. Per scope, replay must fail loudly
 if logs are inconsistent.
 """
 
+import gzip
 import json
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 
+from ai_hunger_games.core.logging_setup import get_logger
 
-@dataclass(frozen=True)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _loads = json.loads
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
 class ReplayRoundSummary:
     """Summary of a replayed round."""
     
@@ -29,6 +44,21 @@ class ReplayInconsistencyError(Exception):
     pass
 
 
+def _parse_lines(lines: Iterable[str | bytes]) -> Iterator[dict]:
+    """Decode JSONL event lines, skipping blank ones."""
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield _loads(line)
+
+
+def _require_round(rounds: dict[int, dict], data: dict, message: str) -> None:
+    """Fail loudly if an event refers to a round that never started."""
+    round_num = data["round_number"]
+    if round_num not in rounds:
+        raise ReplayInconsistencyError(f"{message}: {round_num}")
+
+
 class ReplayEngine:
     """Replays arena execution from event logs.
     
@@ -36,18 +66,57 @@ class ReplayEngine:
     or regenerate any responses. It reconstructs exactly what happened.
     """
     
-    def __init__(self, log_file_path: str) -> None:
+    def __init__(
+        self,
+        source: str | os.PathLike[str] | Iterable[str | bytes]
+    ) -> None:
         """Initialize replay engine.
         
         Args:
-            log_file_path: Path to event log file.
+            source: Path to an event log file, or JSON-encoded event
+                lines in log order.
+        
+        Raises:
+            FileNotFoundError: If source is a path that does not exist.
         """
-        self._log_file = Path(log_file_path)
+        self._log_file: Optional[Path] = None
+        self._lines: Optional[tuple[str | bytes, ...]] = None
         
-        if not self._log_file.exists():
-            raise FileNotFoundError(
-                f"Log file not found: {log_file_path}"
-            )
+        if isinstance(source, (str, os.PathLike)):
+            self._log_file = Path(source)
+            if not self._log_file.exists():
+                raise FileNotFoundError(f"Log file not found: {source}")
+        else:
+            self._lines = tuple(source)
+        
+        self._handlers = self._build_handlers()
+    
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes]) -> "ReplayEngine":
+        """Create a replay engine over in-memory JSONL event lines.
+        
+        Lets callers that already hold the events, such as tests or a
+        log streamed from elsewhere, replay without touching disk.
+        
+        Args:
+            lines: JSON-encoded event lines in log order.
+        
+        Returns:
+            Replay engine reading from the given lines.
+        """
+        return cls(lines)
+    
+    def _build_handlers(
+        self
+    ) -> dict[str, Callable[[dict[int, dict], dict], None]]:
+        """Map event types to the methods that apply them."""
+        return {
+            "RoundStarted": self._on_round_started,
+            "AgentResponded": self._on_agent_responded,
+            "VoteCast": self._on_vote_cast,
+            "VoteSummary": self._on_vote_summary,
+            "EliminationDecided": self._on_elimination_decided,
+        }
     
     def replay(self) -> list[ReplayRoundSummary]:
         """Replay arena execution from logs.
@@ -58,75 +127,79 @@ class ReplayEngine:
         Raises:
             ReplayInconsistencyError: If logs are inconsistent.
         """
-        events = self._load_events()
-        
         rounds: dict[int, dict] = {}
-        eliminated_agents: dict[int, str] = {}
+        handlers = self._handlers
         
-        for event_entry in events:
-            event_type = event_entry["event_type"]
-            data = event_entry["data"]
-            
-            if event_type == "RoundStarted":
-                round_num = data["round_number"]
-                rounds[round_num] = {
-                    "prompt": data["prompt"],
-                    "responses": [],
-                    "votes": [],
-                    "vote_counts": {},
-                    "eliminated": None
-                }
-            
-            elif event_type == "AgentResponded":
-                round_num = data["round_number"]
-                if round_num not in rounds:
-                    raise ReplayInconsistencyError(
-                        f"Response before round start: {round_num}"
-                    )
-                rounds[round_num]["responses"].append(data)
-            
-            elif event_type == "VoteCast":
-                round_num = data["round_number"]
-                if round_num not in rounds:
-                    raise ReplayInconsistencyError(
-                        f"Vote before round start: {round_num}"
-                    )
-                rounds[round_num]["votes"].append(data)
-            
-            elif event_type == "VoteSummary":
-                round_num = data["round_number"]
-                if round_num not in rounds:
-                    raise ReplayInconsistencyError(
-                        f"Vote summary before round: {round_num}"
-                    )
-                rounds[round_num]["vote_counts"] = data["vote_counts"]
-            
-            elif event_type == "EliminationDecided":
-                round_num = data["round_number"]
-                if round_num not in rounds:
-                    raise ReplayInconsistencyError(
-                        f"Elimination before round: {round_num}"
-                    )
-                rounds[round_num]["eliminated"] = data["eliminated_agent_id"]
-                eliminated_agents[round_num] = data["eliminated_agent_id"]
+        for event_entry in self._load_events():
+            handler = handlers.get(event_entry["event_type"])
+            if handler:
+                handler(rounds, event_entry["data"])
         
         return self._build_summaries(rounds)
     
-    def _load_events(self) -> list[dict]:
-        """Load events from log file.
+    def _on_round_started(self, rounds: dict[int, dict], data: dict) -> None:
+        """Open a new round."""
+        rounds[data["round_number"]] = {
+            "prompt": data["prompt"],
+            "num_responses": 0,
+            "num_votes": 0,
+            "vote_counts": {},
+            "eliminated": None
+        }
+    
+    def _on_agent_responded(self, rounds: dict[int, dict], data: dict) -> None:
+        """Count a response in its round."""
+        _require_round(rounds, data, "Response before round start")
+        rounds[data["round_number"]]["num_responses"] += 1
+    
+    def _on_vote_cast(self, rounds: dict[int, dict], data: dict) -> None:
+        """Count a vote in its round."""
+        _require_round(rounds, data, "Vote before round start")
+        rounds[data["round_number"]]["num_votes"] += 1
+    
+    def _on_vote_summary(self, rounds: dict[int, dict], data: dict) -> None:
+        """Record the round's aggregated vote counts."""
+        _require_round(rounds, data, "Vote summary before round")
+        rounds[data["round_number"]]["vote_counts"] = data["vote_counts"]
+    
+    def _on_elimination_decided(
+        self,
+        rounds: dict[int, dict],
+        data: dict
+    ) -> None:
+        """Record the round's eliminated agent."""
+        _require_round(rounds, data, "Elimination before round")
+        rounds[data["round_number"]]["eliminated"] = data["eliminated_agent_id"]
+    
+    def _load_events(self) -> Iterator[dict]:
+        """Stream events from the log source one line at a time.
         
-        Returns:
-            List of event entries.
+        Only per-round counters are kept by replay, so streaming keeps
+        peak memory independent of the log length. Logs ending in .gz
+        are decompressed on the fly; a gzip log whose writer died before
+        close() has no trailer, and is replayed up to its last flush.
+        
+        Yields:
+            Event entries in log order.
         """
-        events = []
+        if self._lines is not None:
+            yield from _parse_lines(self._lines)
+            return
         
-        with self._log_file.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
+        if self._log_file.suffix == ".gz":
+            opened = gzip.open(self._log_file, "rb")
+        else:
+            opened = self._log_file.open("rb")
         
-        return events
+        with opened as f:
+            try:
+                yield from _parse_lines(f)
+            except EOFError:
+                logger.warning(
+                    "Log %s ends without a gzip trailer; replayed the "
+                    "events flushed before it was cut off",
+                    self._log_file
+                )
     
     def _build_summaries(
         self,
@@ -148,8 +221,8 @@ class ReplayEngine:
             summary = ReplayRoundSummary(
                 round_number=round_num,
                 prompt=round_data["prompt"],
-                num_responses=len(round_data["responses"]),
-                num_votes=len(round_data["votes"]),
+                num_responses=round_data["num_responses"],
+                num_votes=round_data["num_votes"],
                 vote_counts=round_data["vote_counts"],
                 eliminated_agent_id=round_data["eliminated"],
                 was_elimination_round=round_data["eliminated"] is not None
@@ -160,28 +233,38 @@ class ReplayEngine:
         return summaries
     
     def print_summary(self) -> None:
-        """Print human-readable summary of replay."""
-        summaries = self.replay()
+        """Print human-readable summary of replay.
         
-        print(f"\n=== Replay Summary ===")
-        print(f"Total rounds: {len(summaries)}\n")
+        The summary is built in memory and emitted with one write, so
+        long games do not pay a print call per line.
+        """
+        sys.stdout.write(_format_summary(self.replay()))
+
+
+def _format_summary(summaries: list[ReplayRoundSummary]) -> str:
+    """Format replayed rounds as the human-readable summary text."""
+    lines = ["\n=== Replay Summary ===", f"Total rounds: {len(summaries)}\n"]
+    
+    for summary in summaries:
+        lines.append(f"Round {summary.round_number}:")
+        lines.append(f"  Prompt: {summary.prompt[:60]}...")
+        lines.append(f"  Responses: {summary.num_responses}")
+        lines.append(f"  Votes cast: {summary.num_votes}")
         
-        for summary in summaries:
-            print(f"Round {summary.round_number}:")
-            print(f"  Prompt: {summary.prompt[:60]}...")
-            print(f"  Responses: {summary.num_responses}")
-            print(f"  Votes cast: {summary.num_votes}")
-            
-            if summary.vote_counts:
-                print(f"  Vote distribution:")
+        if summary.vote_counts:
+            lines.append("  Vote distribution:")
+            lines.extend(
+                f"    {agent_id}: {count} votes"
                 for agent_id, count in sorted(
                     summary.vote_counts.items(),
                     key=lambda x: x[1],
                     reverse=True
-                ):
-                    print(f"    {agent_id}: {count} votes")
-            
-            if summary.was_elimination_round:
-                print(f"  ** ELIMINATED: {summary.eliminated_agent_id} **")
-            
-            print()
+                )
+            )
+        
+        if summary.was_elimination_round:
+            lines.append(f"  ** ELIMINATED: {summary.eliminated_agent_id} **")
+        
+        lines.append("")
+    
+    return "\n".join(lines) + "\n"
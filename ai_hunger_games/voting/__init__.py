@@ -1,12 +1,17 @@
 """Voting module - vote aggregation and tie-breaking."""
 
-from ai_hunger_games.voting.aggregation import aggregate_votes
+from ai_hunger_games.voting.aggregation import aggregate_votes, tally_votes
 from ai_hunger_games.voting.strategy import (
     InvalidVoteError,
     SelfVoteError,
     collect_votes,
 )
-from ai_hunger_games.voting.types import Vote, VoteResult, VotingRoundResult
+from ai_hunger_games.voting.types import (
+    Vote,
+    VoteResult,
+    VotingRoundResult,
+    intern_vote,
+)
 
 __all__ = [
     "InvalidVoteError",
@@ -16,4 +21,6 @@ __all__ = [
     "VotingRoundResult",
     "aggregate_votes",
     "collect_votes",
+    "intern_vote",
+    "tally_votes",
 ]
@@ -4,13 +4,17 @@ Aggregates individual votes into round results with vote counts.
 Pure functions with deterministic behavior.
 """
 
+from collections import Counter
+from operator import attrgetter
+from typing import Iterable
+
 from ai_hunger_games.voting.types import Vote, VoteResult, VotingRoundResult
 
 
 def aggregate_votes(
     votes: list[Vote],
     round_number: int,
-    all_agent_ids: list[str]
+    all_agent_ids: Iterable[str]
 ) -> VotingRoundResult:
     """Aggregate individual votes into round results.
     
@@ -20,18 +24,18 @@ def aggregate_votes(
     Args:
         votes: List of individual votes cast.
         round_number: The round number.
-        all_agent_ids: All agent IDs to include in results.
+        all_agent_ids: All agent IDs to include in results. Consumed once,
+            so a generator avoids building a temporary list.
     
     Returns:
         Complete voting round result with aggregated counts.
     """
-    vote_counts: dict[str, int] = {
-        agent_id: 0 for agent_id in all_agent_ids
-    }
+    vote_counts: dict[str, int] = dict.fromkeys(all_agent_ids, 0)
     
-    for vote in votes:
-        if vote.voted_for_id in vote_counts:
-            vote_counts[vote.voted_for_id] += 1
+    # Votes for unknown agents are dropped
+    for agent_id, count in _count_votes(votes).items():
+        if agent_id in vote_counts:
+            vote_counts[agent_id] += count
     
     results = tuple(
         VoteResult(agent_id=agent_id, votes_received=count)
@@ -43,3 +47,33 @@ def aggregate_votes(
         votes=tuple(votes),
         results=results
     )
+
+
+def tally_votes(votes: Iterable[Vote]) -> tuple[VoteResult, ...]:
+    """Count votes received per voted-for agent.
+    
+    Unlike aggregate_votes, only agents that received at least one vote
+    appear. Results are sorted by agent_id for deterministic output.
+    
+    Args:
+        votes: Individual votes cast.
+    
+    Returns:
+        Vote results for each agent that received votes.
+    """
+    return tuple(
+        VoteResult(agent_id=agent_id, votes_received=count)
+        for agent_id, count in sorted(_count_votes(votes).items())
+    )
+
+
+_voted_for_id = attrgetter("voted_for_id")
+
+
+def _count_votes(votes: Iterable[Vote]) -> Counter[str]:
+    """Tally voted-for IDs.
+    
+    Counter counts in C, and map with attrgetter keeps the attribute
+    reads in C too, so no Python frame runs per vote.
+    """
+    return Counter(map(_voted_for_id, votes))
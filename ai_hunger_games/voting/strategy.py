@@ -4,9 +4,16 @@ Implements single-choice voting where each agent votes for exactly
 one other agent. Self-voting is explicitly forbidden per CODING_RULES.md.
 """
 
-from ai_hunger_games.arena.round_state import RoundState
+from collections.abc import Set
+from typing import TYPE_CHECKING, Optional
+
 from ai_hunger_games.voting.types import Vote
 
+if TYPE_CHECKING:
+    # Annotation only: a runtime import would load the arena package,
+    # whose controller imports this module back.
+    from ai_hunger_games.arena.round_state import RoundState
+
 
 class SelfVoteError(Exception):
     """Raised when an agent attempts to vote for itself."""
@@ -21,17 +28,24 @@ class InvalidVoteError(Exception):
 
 
 def collect_votes(
-    round_state: RoundState,
-    vote_choices: dict[str, str]
+    round_state: "RoundState",
+    vote_choices: dict[str, str],
+    *,
+    known_agent_ids: Optional[Set[str]] = None
 ) -> list[Vote]:
     """Collect votes from all agents for a round.
     
     Validates that no agent votes for itself and that all
-    vote targets exist in the round.
+    vote targets exist in the round. Self-votes are checked first;
+    each error lists every offending vote, not just the first.
     
     Args:
         round_state: The completed round state with all responses.
-        vote_choices: Mapping of voter_id to voted_for_id.
+        vote_choices: Mapping of voter_id to voted_for_id. IDs taken from
+            Agent.agent_id are already interned, so downstream dict and
+            set lookups compare by identity; they are not re-interned here.
+        known_agent_ids: Valid vote targets, for callers that already
+            hold the roster. Defaults to the round's responding agents.
     
     Returns:
         List of validated Vote objects.
@@ -40,25 +54,33 @@ def collect_votes(
         SelfVoteError: If any agent votes for itself.
         InvalidVoteError: If vote target doesn't exist.
     """
-    votes = []
-    agent_ids = {resp.agent_id for resp in round_state.responses}
+    if known_agent_ids is None:
+        known_agent_ids = round_state.agent_id_set()
+    
+    # One pass over the ballot: build votes and collect every bad entry
+    round_number = round_state.round_number
+    votes: list[Vote] = []
+    self_votes: list[str] = []
+    missing: set[str] = set()
     
     for voter_id, voted_for_id in vote_choices.items():
         if voter_id == voted_for_id:
-            raise SelfVoteError(
-                f"Agent '{voter_id}' cannot vote for itself"
-            )
-        
-        if voted_for_id not in agent_ids:
-            raise InvalidVoteError(
-                f"Vote target '{voted_for_id}' not found in round"
-            )
-        
-        vote = Vote(
-            voter_id=voter_id,
-            voted_for_id=voted_for_id,
-            round_number=round_state.round_number
-        )
-        votes.append(vote)
+            self_votes.append(voter_id)
+        elif voted_for_id not in known_agent_ids:
+            missing.add(voted_for_id)
+        else:
+            votes.append(Vote(voter_id, voted_for_id, round_number))
+    
+    if self_votes:
+        raise SelfVoteError("; ".join(
+            f"Agent '{voter_id}' cannot vote for itself"
+            for voter_id in self_votes
+        ))
+    
+    if missing:
+        raise InvalidVoteError("; ".join(
+            f"Vote target '{target}' not found in round"
+            for target in sorted(missing)
+        ))
     
     return votes
@@ -5,9 +5,10 @@ Per ARCHITECTURE.md, voting is single-choice with self-voting forbidden.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vote:
     """A single vote cast by an agent.
     
@@ -20,7 +21,26 @@ class Vote:
     round_number: int
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def intern_vote(voter_id: str, voted_for_id: str, round_number: int) -> Vote:
+    """Return a shared Vote for a (voter, target, round) triple.
+    
+    Votes are immutable, so replays and simulations that see the same
+    triple repeatedly can reuse one instance. The cache is bounded so
+    long runs with mostly unique votes cannot grow it without limit.
+    
+    Args:
+        voter_id: The agent casting the vote.
+        voted_for_id: The agent voted for.
+        round_number: The round the vote belongs to.
+    
+    Returns:
+        A Vote equal to Vote(voter_id, voted_for_id, round_number).
+    """
+    return Vote(voter_id, voted_for_id, round_number)
+
+
+@dataclass(frozen=True, slots=True)
 class VoteResult:
     """Aggregated vote result for a single agent.
     
@@ -31,8 +51,18 @@ class VoteResult:
     votes_received: int
 
 
-@dataclass(frozen=True)
-class VotingRoundResult:
+class _AgentIndexCache:
+    """Slot for VotingRoundResult's lazy agent index.
+    
+    Declared on a base class so the index is not a dataclass field and
+    stays out of fields(), asdict() and the generated __slots__.
+    """
+    
+    __slots__ = ("_index",)
+
+
+@dataclass(frozen=True, slots=True)
+class VotingRoundResult(_AgentIndexCache):
     """Complete voting results for a round.
     
     Contains all individual votes and aggregated results.
@@ -45,13 +75,18 @@ class VotingRoundResult:
     def get_votes_for(self, agent_id: str) -> int:
         """Get the number of votes received by an agent.
         
+        The agent index is built on first query, so per-agent lookups
+        across a round are O(1) instead of a scan of results each time.
+        
         Args:
             agent_id: The agent to query.
         
         Returns:
             Number of votes received.
         """
-        for result in self.results:
-            if result.agent_id == agent_id:
-                return result.votes_received
-        return 0
+        try:
+            index = self._index
+        except AttributeError:
+            index = {r.agent_id: r.votes_received for r in self.results}
+            object.__setattr__(self, "_index", index)
+        return index.get(agent_id, 0)
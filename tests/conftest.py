@@ -0,0 +1,108 @@
+"""Shared pytest fixtures for AI Hunger Games tests."""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from ai_hunger_games.agents.personality import (
+    CommunicationStyle,
+    EthicalStance,
+    Personality,
+    RiskTolerance,
+    SocialStrategy,
+)
+from ai_hunger_games.arena.controller import ArenaController
+from ai_hunger_games.core.config import Settings, load_config
+
+
+@pytest.fixture(scope="session")
+def sample_personality() -> Personality:
+    """Create a sample personality for testing.
+    
+    Session-scoped: Personality is frozen, so one instance is shared.
+    """
+    return Personality(
+        communication_style=CommunicationStyle.CONCISE,
+        ethical_stance=EthicalStance.STRICT,
+        social_strategy=SocialStrategy.COOPERATIVE,
+        risk_tolerance=RiskTolerance.LOW,
+        seed=42
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_settings() -> Settings:
+    """Create sample settings for testing.
+    
+    Session-scoped: Settings is frozen, so one instance is shared.
+    """
+    return Settings(
+        model_name="llama3.1:8b",
+        temperature=0.2,
+        ollama_base_url="http://localhost:11434",
+        num_agents=8,
+        rounds_per_elimination=2,
+        memory_window=5,
+        random_seed=42,
+        log_level="INFO",
+        log_file="logs/test.log"
+    )
+
+
+@pytest.fixture(scope="session")
+def base_config_yaml() -> str:
+    """Canonical valid settings YAML; tests derive variants with replace()."""
+    return """
+model_name: "llama3.1:8b"
+temperature: 0.2
+ollama_base_url: "http://localhost:11434"
+num_agents: 8
+rounds_per_elimination: 2
+memory_window: 5
+random_seed: 42
+log_level: "INFO"
+log_file: "logs/arena.log"
+"""
+
+
+@pytest.fixture
+def base_config_file(tmp_path: Path, base_config_yaml: str) -> Path:
+    """Write the canonical settings YAML to a per-test file."""
+    config_file = tmp_path / "settings.yaml"
+    config_file.write_text(base_config_yaml)
+    return config_file
+
+
+@pytest.fixture(scope="session")
+def base_settings(
+    tmp_path_factory: pytest.TempPathFactory,
+    base_config_yaml: str
+) -> Settings:
+    """Settings loaded once from the canonical YAML.
+    
+    Session-scoped: Settings is frozen, so one instance is shared.
+    """
+    config_file = tmp_path_factory.mktemp("config") / "settings.yaml"
+    config_file.write_text(base_config_yaml)
+    return load_config(config_file)
+
+
+@pytest.fixture
+def make_controller() -> Iterator[Callable[..., ArenaController]]:
+    """Build arena controllers that are shut down when the test ends.
+    
+    Controllers own a worker pool once a round has run, so tests create
+    them through this factory rather than leaking threads.
+    """
+    controllers: list[ArenaController] = []
+    
+    def make(**kwargs: object) -> ArenaController:
+        controller = ArenaController(**kwargs)
+        controllers.append(controller)
+        return controller
+    
+    yield make
+    
+    for controller in controllers:
+        controller.shutdown()
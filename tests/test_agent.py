@@ -3,25 +3,7 @@
 import pytest
 
 from ai_hunger_games.agents.agent import Agent, RoundContext
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
-
-
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
+from ai_hunger_games.agents.personality import Personality
 
 
 class TestAgent:
@@ -1,49 +1,26 @@
 """Tests for arena controller module."""
 
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, fields, replace
 from pathlib import Path
 
 import pytest
 
-from ai_hunger_games.agents.agent import Agent
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.agent import Agent, RoundContext
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.arena.controller import ArenaController, InsufficientAgentsError
-from ai_hunger_games.arena.round_state import RoundState
+from ai_hunger_games.arena.round_state import AgentResponse, RoundState
 from ai_hunger_games.core.config import Settings
+from ai_hunger_games.observability.logger import EventLogger
 
 
-@pytest.fixture
-def sample_settings() -> Settings:
-    """Create sample settings for testing."""
-    return Settings(
-        model_name="llama3.1:8b",
-        temperature=0.2,
-        ollama_base_url="http://localhost:11434",
-        num_agents=8,
-        rounds_per_elimination=2,
-        memory_window=5,
-        random_seed=42,
-        log_level="INFO",
-        log_file="logs/test.log"
-    )
-
-
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
+class _FailingAgent(Agent):
+    """Agent whose response generation always fails."""
+    
+    def generate_response(self, context: RoundContext) -> str:
+        raise RuntimeError("model unavailable")
 
 
 @pytest.fixture
@@ -67,10 +44,11 @@ class TestArenaController:
     def test_create_controller(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test creating an arena controller."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -81,10 +59,11 @@ class TestArenaController:
     def test_start_round(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test starting a round."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -99,10 +78,11 @@ class TestArenaController:
     def test_round_collects_all_responses(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that round collects response from each agent."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -114,13 +94,101 @@ class TestArenaController:
             assert response is not None
             assert len(response) > 0
     
-    def test_current_round_increments(
+    def test_responses_keep_registration_order(
+        self,
+        populated_registry: AgentRegistry,
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
+    ) -> None:
+        """Test that concurrent collection preserves registry order."""
+        controller = make_controller(
+            registry=populated_registry,
+            settings=sample_settings
+        )
+        
+        round_state = controller.start_round("Test prompt")
+        controller.shutdown()
+        
+        agent_ids = [resp.agent_id for resp in round_state.responses]
+        assert agent_ids == populated_registry.get_ids()
+    
+    def test_worker_pool_started_lazily_and_released(
         self,
         populated_registry: AgentRegistry,
         sample_settings: Settings
+    ) -> None:
+        """Test that threads start on the first round and stop on exit."""
+        def arena_threads() -> int:
+            return sum(
+                t.name.startswith("arena-agent") for t in threading.enumerate()
+            )
+        
+        before = arena_threads()
+        with ArenaController(
+            registry=populated_registry,
+            settings=sample_settings
+        ) as controller:
+            assert arena_threads() == before
+            controller.start_round("Test prompt")
+            assert arena_threads() > before
+        
+        assert arena_threads() == before
+    
+    def test_shutdown_closes_event_logger(
+        self,
+        populated_registry: AgentRegistry,
+        sample_settings: Settings,
+        tmp_path: Path
+    ) -> None:
+        """Test that leaving the controller flushes and closes its log."""
+        log_file = tmp_path / "events.log"
+        event_logger = EventLogger(str(log_file), flush_every=100)
+        
+        with ArenaController(
+            registry=populated_registry,
+            settings=sample_settings,
+            event_logger=event_logger
+        ) as controller:
+            controller.start_round("Test prompt")
+        
+        assert event_logger._file is None
+        assert log_file.read_text().count("AgentResponded") == 4
+    
+    def test_failed_agent_logs_no_partial_round(
+        self,
+        populated_registry: AgentRegistry,
+        sample_personality: Personality,
+        sample_settings: Settings,
+        tmp_path: Path,
+        make_controller: Callable[..., ArenaController]
+    ) -> None:
+        """Test that one failing agent aborts before any response is logged."""
+        populated_registry.register(
+            _FailingAgent(agent_id="agent_x", personality=sample_personality)
+        )
+        log_file = tmp_path / "events.log"
+        event_logger = EventLogger(str(log_file))
+        controller = make_controller(
+            registry=populated_registry,
+            settings=sample_settings,
+            event_logger=event_logger
+        )
+        
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            controller.start_round("Test prompt")
+        event_logger.close()
+        
+        assert "AgentResponded" not in log_file.read_text()
+        assert controller.get_round_history() == []
+    
+    def test_current_round_increments(
+        self,
+        populated_registry: AgentRegistry,
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that current round increments with each round."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -136,10 +204,11 @@ class TestArenaController:
     def test_round_history(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that round history is maintained."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -156,10 +225,11 @@ class TestArenaController:
     def test_get_round(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test getting a specific round."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -178,7 +248,8 @@ class TestArenaController:
     def test_insufficient_agents_raises(
         self,
         sample_personality: Personality,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that too few agents raises error."""
         registry = AgentRegistry()
@@ -190,7 +261,7 @@ class TestArenaController:
             )
             registry.register(agent)
         
-        controller = ArenaController(
+        controller = make_controller(
             registry=registry,
             settings=sample_settings
         )
@@ -208,7 +279,7 @@ class TestRoundState:
         
         assert state.round_number == 1
         assert state.prompt == "Test"
-        assert state.responses == []
+        assert state.responses == ()
         assert state.is_complete is False
     
     def test_add_response(self) -> None:
@@ -220,6 +291,16 @@ class TestRoundState:
         
         assert state.response_count() == 2
     
+    def test_extend_responses_matches_add_response(self) -> None:
+        """Test that bulk-added responses are indexed like single ones."""
+        state = RoundState(round_number=1, prompt="Test")
+        
+        state.extend_responses([("agent_1", "Response 1"), ("agent_2", "Response 2")])
+        
+        assert state.response_count() == 2
+        assert [r.agent_id for r in state.responses] == ["agent_1", "agent_2"]
+        assert state.get_response("agent_2") == "Response 2"
+    
     def test_get_response(self) -> None:
         """Test getting a specific agent's response."""
         state = RoundState(round_number=1, prompt="Test")
@@ -230,3 +311,55 @@ class TestRoundState:
         assert state.get_response("agent_1") == "Response 1"
         assert state.get_response("agent_2") == "Response 2"
         assert state.get_response("agent_3") is None
+    
+    def test_constructor_responses_are_indexed(self) -> None:
+        """Test that responses passed to the constructor can be looked up."""
+        state = RoundState(
+            round_number=1,
+            prompt="Test",
+            responses=[
+                AgentResponse("agent_1", "Response 1"),
+                AgentResponse("agent_2", "Response 2"),
+            ]
+        )
+        
+        assert state.get_response("agent_1") == "Response 1"
+        assert set(state.agent_id_set()) == {"agent_1", "agent_2"}
+    
+    def test_index_is_not_a_dataclass_field(self) -> None:
+        """Test that fields() and asdict() only carry round data."""
+        state = RoundState(round_number=1, prompt="Test")
+        state.add_response("agent_1", "Response 1")
+        
+        assert [f.name for f in fields(state)] == [
+            "round_number", "prompt", "responses", "is_complete"
+        ]
+        assert "_by_id" not in asdict(state)
+    
+    def test_responses_cannot_be_mutated_in_place(self) -> None:
+        """Test that responses can only grow through the indexed methods."""
+        state = RoundState(round_number=1, prompt="Test")
+        state.add_response("agent_1", "Response 1")
+        
+        assert isinstance(state.responses, tuple)
+        with pytest.raises(AttributeError):
+            state.responses.append(AgentResponse("agent_2", "Response 2"))
+    
+    def test_replaced_copy_has_independent_index(self) -> None:
+        """Test that a dataclasses.replace() copy does not share its index."""
+        state = RoundState(round_number=1, prompt="Test")
+        copy = replace(state, responses=())
+        
+        copy.add_response("agent_1", "Response 1")
+        
+        assert state.get_response("agent_1") is None
+    
+    def test_agent_id_set_tracks_added_responses(self) -> None:
+        """Test that the agent ID view reflects responses added later."""
+        state = RoundState(round_number=1, prompt="Test")
+        agent_ids = state.agent_id_set()
+        
+        state.add_response("agent_1", "Response 1")
+        
+        assert "agent_1" in agent_ids
+        assert "agent_2" not in agent_ids
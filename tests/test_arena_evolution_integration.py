@@ -1,15 +1,11 @@
 """Tests for ArenaController evolution integration."""
 
+from collections.abc import Callable
+
 import pytest
 
 from ai_hunger_games.agents.agent import Agent
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.arena.controller import ArenaController
 from ai_hunger_games.arena.elimination import EliminationResult
@@ -18,34 +14,6 @@ from ai_hunger_games.evolution.personality_generator import PersonalityGenerator
 from ai_hunger_games.evolution.replacement import AgentReplacementCoordinator
 
 
-@pytest.fixture
-def sample_settings() -> Settings:
-    """Create sample settings for testing."""
-    return Settings(
-        model_name="llama3.1:8b",
-        temperature=0.2,
-        ollama_base_url="http://localhost:11434",
-        num_agents=8,
-        rounds_per_elimination=2,
-        memory_window=5,
-        random_seed=42,
-        log_level="INFO",
-        log_file="logs/test.log"
-    )
-
-
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
-
-
 @pytest.fixture
 def populated_registry(sample_personality: Personality) -> AgentRegistry:
     """Create a registry with 4 agents."""
@@ -67,10 +35,11 @@ class TestArenaControllerReplacement:
     def test_execute_replacement_without_coordinator(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that replacement does nothing without coordinator."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
             # No replacement_coordinator
@@ -91,7 +60,8 @@ class TestArenaControllerReplacement:
     def test_execute_replacement_with_coordinator(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test executing replacement with coordinator."""
         generator = PersonalityGenerator(base_seed=sample_settings.random_seed)
@@ -101,7 +71,7 @@ class TestArenaControllerReplacement:
             memory_window=sample_settings.memory_window
         )
         
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings,
             replacement_coordinator=coordinator
@@ -133,7 +103,8 @@ class TestArenaControllerReplacement:
     def test_full_cycle_with_replacement(
         self,
         sample_personality: Personality,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test full cycle: round, voting, elimination, replacement."""
         registry = AgentRegistry()
@@ -151,7 +122,7 @@ class TestArenaControllerReplacement:
             generator=generator
         )
         
-        controller = ArenaController(
+        controller = make_controller(
             registry=registry,
             settings=sample_settings,
             replacement_coordinator=coordinator
@@ -1,49 +1,17 @@
 """Tests for ArenaController voting and elimination integration."""
 
+from collections.abc import Callable
+
 import pytest
 
 from ai_hunger_games.agents.agent import Agent
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.arena.controller import ArenaController
 from ai_hunger_games.core.config import Settings
 from ai_hunger_games.voting.strategy import SelfVoteError
 
 
-@pytest.fixture
-def sample_settings() -> Settings:
-    """Create sample settings for testing."""
-    return Settings(
-        model_name="llama3.1:8b",
-        temperature=0.2,
-        ollama_base_url="http://localhost:11434",
-        num_agents=8,
-        rounds_per_elimination=2,
-        memory_window=5,
-        random_seed=42,
-        log_level="INFO",
-        log_file="logs/test.log"
-    )
-
-
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
-
-
 @pytest.fixture
 def populated_registry(sample_personality: Personality) -> AgentRegistry:
     """Create a registry with 4 agents."""
@@ -65,10 +33,11 @@ class TestArenaControllerVoting:
     def test_conduct_voting(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test conducting a voting round."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -94,10 +63,11 @@ class TestArenaControllerVoting:
     def test_conduct_voting_validates_self_vote(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that self-voting is caught during voting."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -115,10 +85,11 @@ class TestArenaControllerVoting:
     def test_cumulative_votes_tracking(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that cumulative votes are tracked across rounds."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -145,6 +116,10 @@ class TestArenaControllerVoting:
         assert controller._cumulative_votes["agent_1"] == 6
         assert controller._cumulative_votes["agent_2"] == 2  # 1 per round
         assert controller._cumulative_votes["agent_0"] == 0
+        
+        snapshot = controller.cumulative_votes
+        snapshot["agent_1"] = 0
+        assert controller.cumulative_votes["agent_1"] == 6
 
 
 class TestArenaControllerElimination:
@@ -153,10 +128,11 @@ class TestArenaControllerElimination:
     def test_determine_elimination_candidate(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test determining elimination candidate."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -178,10 +154,11 @@ class TestArenaControllerElimination:
     def test_elimination_without_voting_raises(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that elimination without voting raises error."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -194,10 +171,11 @@ class TestArenaControllerElimination:
     def test_elimination_with_tie_breaking(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test elimination when agents are tied."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -230,10 +208,11 @@ class TestArenaControllerElimination:
     def test_historical_average_calculation(
         self,
         populated_registry: AgentRegistry,
-        sample_settings: Settings
+        sample_settings: Settings,
+        make_controller: Callable[..., ArenaController]
     ) -> None:
         """Test that historical average is calculated correctly."""
-        controller = ArenaController(
+        controller = make_controller(
             registry=populated_registry,
             settings=sample_settings
         )
@@ -1,33 +1,46 @@
 """Tests for configuration loading and validation."""
 
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 import pytest
 
-from ai_hunger_games.core.config import ConfigError, Settings, load_config
+from ai_hunger_games.core.config import (
+    ConfigError,
+    Settings,
+    _from_mapping,
+    load_config,
+)
+
+
+# Expected error messages, matched with pytest.raises(match=...).
+_ERR_MAX_PARALLEL = "max_parallel_agents"
+_ERR_NOT_FOUND = "Configuration file not found"
+_ERR_MISSING_KEY = "Missing required config key"
+_ERR_BAD_TEMPERATURE = "Invalid type for temperature"
+_ERR_EMPTY_FILE = "Configuration file is empty"
+
+
+# In-memory twin of the base_config_yaml fixture for tests that only
+# exercise validation; _from_mapping copies it, so sharing is safe.
+_BASE_CONFIG = {
+    "model_name": "llama3.1:8b",
+    "temperature": 0.2,
+    "ollama_base_url": "http://localhost:11434",
+    "num_agents": 8,
+    "rounds_per_elimination": 2,
+    "memory_window": 5,
+    "random_seed": 42,
+    "log_level": "INFO",
+    "log_file": "logs/arena.log",
+}
 
 
 class TestLoadConfig:
     """Tests for load_config function."""
     
-    def test_load_valid_config(self, tmp_path: Path) -> None:
+    def test_load_valid_config(self, base_settings: Settings) -> None:
         """Test loading a valid configuration file."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: 0.2
-ollama_base_url: "http://localhost:11434"
-num_agents: 8
-rounds_per_elimination: 2
-memory_window: 5
-random_seed: 42
-log_level: "INFO"
-log_file: "logs/arena.log"
-"""
-        config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
-        
-        settings = load_config(config_file)
+        settings = base_settings
         
         assert isinstance(settings, Settings)
         assert settings.model_name == "llama3.1:8b"
@@ -39,62 +52,29 @@ log_file: "logs/arena.log"
         assert settings.random_seed == 42
         assert settings.log_level == "INFO"
         assert settings.log_file == "logs/arena.log"
+        assert settings.max_parallel_agents == 8
     
-    def test_load_config_with_int_temperature(self, tmp_path: Path) -> None:
-        """Test that integer temperature is converted to float."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: 0
-ollama_base_url: "http://localhost:11434"
-num_agents: 8
-rounds_per_elimination: 2
-memory_window: 5
-random_seed: 42
-log_level: "INFO"
-log_file: "logs/arena.log"
-"""
+    def test_load_config_invalid_max_parallel_agents(
+        self, tmp_path: Path, base_config_yaml: str
+    ) -> None:
+        """Test that a non-positive worker count raises ConfigError."""
         config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
-        
-        settings = load_config(config_file)
+        config_file.write_text(base_config_yaml + "max_parallel_agents: 0\n")
         
-        assert settings.temperature == 0.0
-        assert isinstance(settings.temperature, float)
+        with pytest.raises(ConfigError, match=_ERR_MAX_PARALLEL):
+            load_config(config_file)
     
     def test_load_config_file_not_found(self) -> None:
         """Test that missing config file raises ConfigError."""
-        with pytest.raises(ConfigError, match="Configuration file not found"):
+        with pytest.raises(ConfigError, match=_ERR_NOT_FOUND):
             load_config(Path("/nonexistent/path/config.yaml"))
     
     def test_load_config_missing_required_key(self, tmp_path: Path) -> None:
-        """Test that missing required key raises ConfigError."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: 0.2
-"""
-        config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
-        
-        with pytest.raises(ConfigError, match="Missing required config key"):
-            load_config(config_file)
-    
-    def test_load_config_invalid_type(self, tmp_path: Path) -> None:
-        """Test that invalid type raises ConfigError."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: "not_a_number"
-ollama_base_url: "http://localhost:11434"
-num_agents: 8
-rounds_per_elimination: 2
-memory_window: 5
-random_seed: 42
-log_level: "INFO"
-log_file: "logs/arena.log"
-"""
+        """Test that a YAML file missing a required key raises ConfigError."""
         config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
+        config_file.write_text("model_name: llama3.1:8b\ntemperature: 0.2\n")
         
-        with pytest.raises(ConfigError, match="Invalid type for temperature"):
+        with pytest.raises(ConfigError, match=_ERR_MISSING_KEY):
             load_config(config_file)
     
     def test_load_config_empty_file(self, tmp_path: Path) -> None:
@@ -102,57 +82,80 @@ log_file: "logs/arena.log"
         config_file = tmp_path / "settings.yaml"
         config_file.write_text("")
         
-        with pytest.raises(ConfigError, match="Configuration file is empty"):
+        with pytest.raises(ConfigError, match=_ERR_EMPTY_FILE):
             load_config(config_file)
     
-    def test_load_config_with_overrides(self, tmp_path: Path) -> None:
-        """Test that CLI overrides are applied correctly."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: 0.2
-ollama_base_url: "http://localhost:11434"
-num_agents: 8
-rounds_per_elimination: 2
-memory_window: 5
-random_seed: 42
-log_level: "INFO"
-log_file: "logs/arena.log"
-"""
-        config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
+    def test_load_config_cached_until_file_changes(
+        self, base_config_file: Path, base_config_yaml: str
+    ) -> None:
+        """Test that unchanged files reuse settings and edits reload them."""
+        config_file = base_config_file
+        
+        first = load_config(config_file)
+        assert load_config(config_file) is first
         
+        config_file.write_text(
+            base_config_yaml.replace("num_agents: 8", "num_agents: 12")
+        )
+        reloaded = load_config(config_file)
+        
+        assert reloaded.num_agents == 12
+    
+    def test_load_config_file_with_overrides(
+        self, base_config_file: Path
+    ) -> None:
+        """Test that overrides also apply on the YAML file path."""
+        settings = load_config(base_config_file, overrides={"num_agents": 4})
+        
+        assert settings.num_agents == 4
+
+
+class TestConfigMappingValidation:
+    """Tests for validating an in-memory mapping via _from_mapping.
+    
+    These skip YAML entirely; file-level behavior is in TestLoadConfig.
+    """
+    
+    def test_int_temperature_converted_to_float(self) -> None:
+        """Test that integer temperature is converted to float."""
+        settings = _from_mapping({**_BASE_CONFIG, "temperature": 0})
+        
+        assert settings.temperature == 0.0
+        assert isinstance(settings.temperature, float)
+    
+    def test_missing_required_key(self) -> None:
+        """Test that missing required key raises ConfigError."""
+        config = {"model_name": "llama3.1:8b", "temperature": 0.2}
+        
+        with pytest.raises(ConfigError, match=_ERR_MISSING_KEY):
+            _from_mapping(config)
+    
+    def test_invalid_type(self) -> None:
+        """Test that invalid type raises ConfigError."""
+        config = {**_BASE_CONFIG, "temperature": "not_a_number"}
+        
+        with pytest.raises(ConfigError, match=_ERR_BAD_TEMPERATURE):
+            _from_mapping(config)
+    
+    def test_overrides_applied_without_mutating_input(self) -> None:
+        """Test that CLI overrides are applied correctly."""
         overrides = {
             "num_agents": 4,
             "temperature": 0.5,
         }
         
-        settings = load_config(config_file, overrides=overrides)
+        settings = _from_mapping(_BASE_CONFIG, overrides=overrides)
         
         assert settings.num_agents == 4
         assert settings.temperature == 0.5
         assert settings.model_name == "llama3.1:8b"
+        assert _BASE_CONFIG["num_agents"] == 8
 
 
 class TestSettingsImmutability:
     """Tests for Settings dataclass immutability."""
     
-    def test_settings_is_frozen(self, tmp_path: Path) -> None:
+    def test_settings_is_frozen(self, base_settings: Settings) -> None:
         """Test that Settings cannot be modified after creation."""
-        config_content = """
-model_name: "llama3.1:8b"
-temperature: 0.2
-ollama_base_url: "http://localhost:11434"
-num_agents: 8
-rounds_per_elimination: 2
-memory_window: 5
-random_seed: 42
-log_level: "INFO"
-log_file: "logs/arena.log"
-"""
-        config_file = tmp_path / "settings.yaml"
-        config_file.write_text(config_content)
-        
-        settings = load_config(config_file)
-        
         with pytest.raises(AttributeError):
-            settings.num_agents = 10
+            base_settings.num_agents = 10
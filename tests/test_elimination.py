@@ -4,91 +4,118 @@ import pytest
 
 from ai_hunger_games.arena.elimination import (
     EliminationCandidate,
+    compute_tie_break_key,
     determine_elimination,
 )
 
 
-class TestDetermineElimination:
-    """Tests for determine_elimination function."""
-    
-    def test_eliminate_highest_votes(self) -> None:
-        """Test that agent with highest votes is eliminated."""
-        candidates = [
-            EliminationCandidate("agent_1", cumulative_votes=5, historical_average=1.5),
-            EliminationCandidate("agent_2", cumulative_votes=10, historical_average=2.0),
-            EliminationCandidate("agent_3", cumulative_votes=3, historical_average=1.0),
-        ]
-        
-        result = determine_elimination(candidates, seed=42)
-        
-        assert result.eliminated_agent_id == "agent_2"
-        assert result.cumulative_votes == 10
-        assert result.was_tie is False
-    
-    def test_tie_broken_by_historical_average(self) -> None:
-        """Test that ties are broken by lowest historical average."""
-        candidates = [
-            EliminationCandidate("agent_1", cumulative_votes=10, historical_average=2.0),
-            EliminationCandidate("agent_2", cumulative_votes=10, historical_average=1.5),
-            EliminationCandidate("agent_3", cumulative_votes=5, historical_average=1.0),
-        ]
-        
-        result = determine_elimination(candidates, seed=42)
-        
-        # agent_2 has same votes as agent_1 but lower historical average
-        assert result.eliminated_agent_id == "agent_2"
-        assert result.was_tie is True
+_ERR_NO_CANDIDATES = "no candidates"
+
+
+_C = EliminationCandidate
+
+# Candidates are frozen, so scenarios share instances across cases.
+_LOW_5 = _C("agent_1", cumulative_votes=5, historical_average=1.5)
+_HIGH_10 = _C("agent_2", cumulative_votes=10, historical_average=2.0)
+_LOW_3 = _C("agent_3", cumulative_votes=3, historical_average=1.0)
+_TIED_AVG_2 = _C("agent_1", cumulative_votes=10, historical_average=2.0)
+_TIED_AVG_1_5 = _C("agent_2", cumulative_votes=10, historical_average=1.5)
+_TIED_AVG_2_B = _C("agent_2", cumulative_votes=10, historical_average=2.0)
+_TRAILING = _C("agent_3", cumulative_votes=5, historical_average=1.0)
+_SAME = tuple(
+    _C(f"agent_{i}", cumulative_votes=5, historical_average=1.0)
+    for i in range(1, 4)
+)
+
+
+@pytest.mark.parametrize(
+    ("candidates", "expected_id", "expected_votes", "expected_tie"),
+    [
+        ((_LOW_5, _HIGH_10, _LOW_3), "agent_2", 10, False),
+        # agent_2 ties agent_1 on votes but has the lower average
+        ((_TIED_AVG_2, _TIED_AVG_1_5, _TRAILING), "agent_2", 10, True),
+        (
+            (
+                _C("agent_1", 10, 2.0, tie_break_key=7),
+                _C("agent_2", 10, 2.0, tie_break_key=3),
+            ),
+            "agent_2", 10, True,
+        ),
+        ((_SAME[0],), "agent_1", 5, False),
+    ],
+    ids=[
+        "highest_votes",
+        "tie_by_historical_average",
+        "tie_by_precomputed_key",
+        "single_candidate",
+    ],
+)
+def test_determine_elimination(
+    candidates: tuple[EliminationCandidate, ...],
+    expected_id: str,
+    expected_votes: int,
+    expected_tie: bool
+) -> None:
+    """Test elimination picks the expected agent for each scenario."""
+    result = determine_elimination(candidates, seed=42)
     
-    def test_tie_broken_by_seed(self) -> None:
-        """Test that final tie is broken deterministically by seed."""
-        candidates = [
-            EliminationCandidate("agent_1", cumulative_votes=10, historical_average=2.0),
-            EliminationCandidate("agent_2", cumulative_votes=10, historical_average=2.0),
-            EliminationCandidate("agent_3", cumulative_votes=5, historical_average=1.0),
-        ]
-        
-        result1 = determine_elimination(candidates, seed=42)
-        result2 = determine_elimination(candidates, seed=42)
-        result3 = determine_elimination(candidates, seed=99)
-        
-        # Same seed should give same result
-        assert result1.eliminated_agent_id == result2.eliminated_agent_id
-        assert result1.was_tie is True
-        
-        # Different seed might give different result (not guaranteed but likely)
-        # Just verify it's still one of the tied candidates
-        assert result3.eliminated_agent_id in ["agent_1", "agent_2"]
+    assert result.eliminated_agent_id == expected_id
+    assert result.cumulative_votes == expected_votes
+    assert result.was_tie is expected_tie
+
+
+@pytest.mark.parametrize(
+    ("candidates", "tied_ids"),
+    [
+        ((_TIED_AVG_2, _TIED_AVG_2_B, _TRAILING), {"agent_1", "agent_2"}),
+        (_SAME, {"agent_1", "agent_2", "agent_3"}),
+    ],
+    ids=["two_way_tie", "all_identical"],
+)
+def test_final_tie_broken_by_seed(
+    candidates: tuple[EliminationCandidate, ...],
+    tied_ids: set[str]
+) -> None:
+    """Test that a full tie is broken deterministically by seed."""
+    result = determine_elimination(candidates, seed=42)
     
-    def test_single_candidate(self) -> None:
-        """Test with only one candidate."""
-        candidates = [
-            EliminationCandidate("agent_1", cumulative_votes=5, historical_average=1.0),
-        ]
-        
-        result = determine_elimination(candidates, seed=42)
-        
-        assert result.eliminated_agent_id == "agent_1"
-        assert result.was_tie is False
+    # Same seed should give same result
+    assert determine_elimination(candidates, seed=42) == result
+    assert result.eliminated_agent_id in tied_ids
+    assert result.was_tie is True
     
-    def test_empty_candidates_raises(self) -> None:
-        """Test that empty candidate list raises error."""
-        with pytest.raises(ValueError, match="no candidates"):
-            determine_elimination([], seed=42)
+    # A different seed may pick differently, but only among the tied
+    other = determine_elimination(candidates, seed=99)
+    assert other.eliminated_agent_id in tied_ids
+
+
+def test_tie_break_key_is_stable_across_processes() -> None:
+    """Test that the tie-break key does not depend on PYTHONHASHSEED."""
+    assert compute_tie_break_key("agent_1", 0) == 1130311949043929889
+    assert compute_tie_break_key("agent_1", 42) == 1130311949043929889 ^ 42
+
+
+def test_precomputed_key_matches_computed_key() -> None:
+    """Test that precomputing keys does not change the tie-break."""
+    precomputed = tuple(
+        _C(
+            c.agent_id,
+            c.cumulative_votes,
+            c.historical_average,
+            tie_break_key=compute_tie_break_key(c.agent_id, 42),
+        )
+        for c in _SAME
+    )
     
-    def test_all_same_votes_and_average(self) -> None:
-        """Test when all candidates have identical scores."""
-        candidates = [
-            EliminationCandidate("agent_1", cumulative_votes=5, historical_average=1.0),
-            EliminationCandidate("agent_2", cumulative_votes=5, historical_average=1.0),
-            EliminationCandidate("agent_3", cumulative_votes=5, historical_average=1.0),
-        ]
-        
-        result = determine_elimination(candidates, seed=42)
-        
-        # Should deterministically pick one
-        assert result.eliminated_agent_id in ["agent_1", "agent_2", "agent_3"]
-        assert result.cumulative_votes == 5
-        assert result.was_tie is True
+    assert determine_elimination(precomputed, seed=42) == (
+        determine_elimination(_SAME, seed=42)
+    )
+
+
+def test_empty_candidates_raises() -> None:
+    """Test that empty candidate list raises error."""
+    with pytest.raises(ValueError, match=_ERR_NO_CANDIDATES):
+        determine_elimination([], seed=42)
 
 
 class TestEliminationCandidate:
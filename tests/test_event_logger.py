@@ -1,69 +1,109 @@
 """Tests for event logger module."""
 
-import json
-import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from orjson import loads
+except ImportError:  # optional speedup, mirrors observability.replay
+    from json import loads
+
 from ai_hunger_games.observability.logger import EventLogger
 
 
 class TestEventLogger:
     """Tests for EventLogger class."""
     
-    def test_create_logger(self) -> None:
+    def test_create_logger(self, tmp_path: Path) -> None:
         """Test creating an event logger."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            logger = EventLogger(str(log_file))
-            
-            assert log_file.exists()
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file))
+        
+        assert log_file.exists()
     
-    def test_log_round_started(self) -> None:
+    def test_log_round_started(self, tmp_path: Path) -> None:
         """Test logging round started event."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            logger = EventLogger(str(log_file))
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file))
+        
+        logger.log_round_started(round_number=1, prompt="Test prompt")
+        logger.close()
+        
+        with log_file.open("r") as f:
+            line = f.readline()
+            entry = loads(line)
             
-            logger.log_round_started(round_number=1, prompt="Test prompt")
+            assert entry["event_type"] == "RoundStarted"
+            assert entry["data"]["round_number"] == 1
+            assert entry["data"]["prompt"] == "Test prompt"
             
-            with log_file.open("r") as f:
-                line = f.readline()
-                entry = json.loads(line)
-                
-                assert entry["event_type"] == "RoundStarted"
-                assert entry["data"]["round_number"] == 1
-                assert entry["data"]["prompt"] == "Test prompt"
+            timestamp = datetime.fromisoformat(entry["data"]["timestamp"])
+            assert timestamp.utcoffset() == timedelta(0)
     
-    def test_log_vote_cast(self) -> None:
+    def test_log_vote_cast(self, tmp_path: Path) -> None:
         """Test logging vote cast event."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            logger = EventLogger(str(log_file))
-            
-            logger.log_vote_cast(
-                round_number=1,
-                voter_id="agent_1",
-                voted_for_id="agent_2"
-            )
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file))
+        
+        logger.log_vote_cast(
+            round_number=1,
+            voter_id="agent_1",
+            voted_for_id="agent_2"
+        )
+        logger.close()
+        
+        with log_file.open("r") as f:
+            line = f.readline()
+            entry = loads(line)
             
-            with log_file.open("r") as f:
-                line = f.readline()
-                entry = json.loads(line)
-                
-                assert entry["event_type"] == "VoteCast"
-                assert entry["data"]["voter_id"] == "agent_1"
-                assert entry["data"]["voted_for_id"] == "agent_2"
+            assert entry["event_type"] == "VoteCast"
+            assert entry["data"]["voter_id"] == "agent_1"
+            assert entry["data"]["voted_for_id"] == "agent_2"
     
-    def test_append_only(self) -> None:
+    def test_append_only(self, tmp_path: Path) -> None:
         """Test that logger appends to existing file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            logger = EventLogger(str(log_file))
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file))
+        
+        logger.log_round_started(round_number=1, prompt="Prompt 1")
+        logger.log_round_started(round_number=2, prompt="Prompt 2")
+        logger.close()
+        
+        with EventLogger(str(log_file)) as reopened:
+            reopened.log_round_started(round_number=3, prompt="Prompt 3")
+        
+        with log_file.open("r") as f:
+            lines = f.readlines()
             
-            logger.log_round_started(round_number=1, prompt="Prompt 1")
-            logger.log_round_started(round_number=2, prompt="Prompt 2")
-            
-            with log_file.open("r") as f:
-                lines = f.readlines()
-                
-                assert len(lines) == 2
+            assert len(lines) == 3
+    
+    def test_flush_every_buffers_until_threshold(self, tmp_path: Path) -> None:
+        """Test that batched flushing holds events until flushed."""
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file), flush_every=2)
+        
+        logger.log_round_started(round_number=1, prompt="Prompt 1")
+        assert log_file.read_text() == ""
+        
+        logger.log_round_started(round_number=2, prompt="Prompt 2")
+        assert len(log_file.read_text().splitlines()) == 2
+        logger.close()
+    
+    def test_log_vote_cast_bulk(self, tmp_path: Path) -> None:
+        """Test that bulk vote logging writes one line per vote in order."""
+        log_file = tmp_path / "test.log"
+        logger = EventLogger(str(log_file))
+        
+        logger.log_vote_cast_bulk(
+            round_number=3,
+            votes=[("agent_1", "agent_2"), ("agent_2", "agent_1")]
+        )
+        logger.close()
+        
+        with log_file.open("r") as f:
+            entries = [loads(line) for line in f]
+        
+        assert [e["event_type"] for e in entries] == ["VoteCast"] * 2
+        assert entries[0]["data"]["voter_id"] == "agent_1"
+        assert entries[1]["data"]["voter_id"] == "agent_2"
+        assert entries[1]["data"]["round_number"] == 3
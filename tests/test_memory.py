@@ -1,10 +1,22 @@
 """Tests for agent memory module."""
 
+from dataclasses import fields
+
 import pytest
 
 from ai_hunger_games.agents.memory import AgentMemory, MemoryEntry, VoteCounts
 
 
+_ERR_WINDOW_SIZE = "at least 1"
+
+
+# Entries are frozen, so one set is shared; only AgentMemory is per-test.
+_ENTRIES = tuple(
+    MemoryEntry(round_number=i + 1, prompt=f"P{i}", response=f"R{i}")
+    for i in range(10)
+)
+
+
 class TestVoteCounts:
     """Tests for VoteCounts dataclass."""
     
@@ -65,6 +77,23 @@ class TestMemoryEntry:
         
         with pytest.raises(AttributeError):
             entry.round_number = 2
+    
+    def test_memory_entry_has_no_instance_dict(self) -> None:
+        """Test that entries are slotted to keep per-round memory small."""
+        entry = MemoryEntry(
+            round_number=1,
+            prompt="Test",
+            response="Response"
+        )
+        
+        assert not hasattr(entry, "__dict__")
+    
+    def test_memory_entry_hash_cache_is_not_a_field(self) -> None:
+        """Test that the cached hash is kept out of the dataclass fields."""
+        entry = _ENTRIES[0]
+        hash(entry)
+        
+        assert "_hash" not in {f.name for f in fields(entry)}
 
 
 class TestAgentMemory:
@@ -85,21 +114,18 @@ class TestAgentMemory:
     
     def test_invalid_window_size(self) -> None:
         """Test that window size must be positive."""
-        with pytest.raises(ValueError, match="at least 1"):
+        with pytest.raises(ValueError, match=_ERR_WINDOW_SIZE):
             AgentMemory(window_size=0)
         
-        with pytest.raises(ValueError, match="at least 1"):
+        with pytest.raises(ValueError, match=_ERR_WINDOW_SIZE):
             AgentMemory(window_size=-1)
     
     def test_add_and_get_entries(self) -> None:
         """Test adding and retrieving entries."""
         memory = AgentMemory(window_size=5)
         
-        entry1 = MemoryEntry(round_number=1, prompt="P1", response="R1")
-        entry2 = MemoryEntry(round_number=2, prompt="P2", response="R2")
-        
-        memory.add_entry(entry1)
-        memory.add_entry(entry2)
+        for entry in _ENTRIES[:2]:
+            memory.add_entry(entry)
         
         entries = memory.get_entries()
         assert len(entries) == 2
@@ -110,8 +136,7 @@ class TestAgentMemory:
         """Test that old entries are dropped when window exceeded."""
         memory = AgentMemory(window_size=3)
         
-        for i in range(5):
-            entry = MemoryEntry(round_number=i + 1, prompt=f"P{i}", response=f"R{i}")
+        for entry in _ENTRIES[:5]:
             memory.add_entry(entry)
         
         entries = memory.get_entries()
@@ -126,13 +151,10 @@ class TestAgentMemory:
         
         assert memory.get_latest() is None
         
-        entry1 = MemoryEntry(round_number=1, prompt="P1", response="R1")
-        entry2 = MemoryEntry(round_number=2, prompt="P2", response="R2")
-        
-        memory.add_entry(entry1)
+        memory.add_entry(_ENTRIES[0])
         assert memory.get_latest().round_number == 1
         
-        memory.add_entry(entry2)
+        memory.add_entry(_ENTRIES[1])
         assert memory.get_latest().round_number == 2
     
     def test_count(self) -> None:
@@ -141,8 +163,7 @@ class TestAgentMemory:
         
         assert memory.count() == 0
         
-        for i in range(3):
-            entry = MemoryEntry(round_number=i + 1, prompt=f"P{i}", response=f"R{i}")
+        for entry in _ENTRIES[:3]:
             memory.add_entry(entry)
         
         assert memory.count() == 3
@@ -151,8 +172,7 @@ class TestAgentMemory:
         """Test clearing memory."""
         memory = AgentMemory()
         
-        entry = MemoryEntry(round_number=1, prompt="P", response="R")
-        memory.add_entry(entry)
+        memory.add_entry(_ENTRIES[0])
         assert memory.count() == 1
         
         memory.clear()
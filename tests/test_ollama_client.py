@@ -1,54 +1,99 @@
 """Tests for Ollama client connectivity."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 
 from ai_hunger_games.core.ollama_client import (
+    AsyncOllamaClient,
     OllamaClient,
     OllamaConnectionError,
     OllamaModel,
+    health_check_all,
 )
 
 
+_ERR_CONNECT = "Failed to connect"
+
+
+_MODELS_TWO = {
+    "models": [
+        {"name": "llama3.1:8b", "size": 4_000_000_000},
+        {"name": "mistral:7b", "size": 3_500_000_000},
+    ]
+}
+_MODELS_ONE_MISTRAL = {
+    "models": [{"name": "mistral:7b", "size": 3_500_000_000}]
+}
+
+
+def _response(
+    status_code: int = 200,
+    payload: dict | None = None,
+    text: str = ""
+) -> SimpleNamespace:
+    """Build a lightweight response object for _StubClient."""
+    return SimpleNamespace(
+        status_code=status_code,
+        json=lambda: payload or {},
+        text=text,
+        raise_for_status=lambda: None,
+    )
+
+
+class _StubClient:
+    """Minimal stand-in for httpx.Client serving canned results.
+    
+    GET results are served in order; a dict is treated as the JSON
+    payload of a 200 response. POST results are served the same way.
+    """
+    
+    def __init__(self, *results: object, post: tuple = ()) -> None:
+        self._results = list(results)
+        self._post_results = list(post)
+        self.get_calls: list[str] = []
+        self.post_calls: list[str] = []
+    
+    def get(self, url: str) -> SimpleNamespace:
+        self.get_calls.append(url)
+        return self._serve(self._results.pop(0))
+    
+    def post(self, url: str, json: dict) -> SimpleNamespace:
+        self.post_calls.append(url)
+        return self._serve(self._post_results.pop(0))
+    
+    @staticmethod
+    def _serve(result: object) -> SimpleNamespace:
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, dict):
+            return _response(payload=result)
+        return result
+
+
 class TestOllamaClientHealthCheck:
     """Tests for OllamaClient.health_check method."""
     
-    def test_health_check_success(self) -> None:
-        """Test health check returns True when Ollama responds."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
-            
-            client = OllamaClient("http://localhost:11434")
-            result = client.health_check()
-            
-            assert result is True
-            mock_get.assert_called_once_with("http://localhost:11434/api/tags")
-    
-    def test_health_check_failure_status(self) -> None:
-        """Test health check returns False on non-200 status."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_get.return_value = mock_response
-            
-            client = OllamaClient("http://localhost:11434")
-            result = client.health_check()
-            
-            assert result is False
-    
-    def test_health_check_connection_error(self) -> None:
-        """Test health check returns False on connection error."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
-            
-            client = OllamaClient("http://localhost:11434")
-            result = client.health_check()
-            
-            assert result is False
+    @pytest.mark.parametrize(
+        ("result", "expected"),
+        [
+            (_response(200), True),
+            (_response(500), False),
+            (httpx.ConnectError("Connection refused"), False),
+        ],
+        ids=["success", "failure_status", "connection_error"],
+    )
+    def test_health_check(self, result: object, expected: bool) -> None:
+        """Test health check maps responses and errors to a bool."""
+        stub = _StubClient(result)
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        assert client.health_check() is expected
+        assert stub.get_calls == ["http://localhost:11434/api/tags"]
 
 
 class TestOllamaClientListModels:
@@ -56,94 +101,146 @@ class TestOllamaClientListModels:
     
     def test_list_models_success(self) -> None:
         """Test listing models returns parsed model data."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "models": [
-                    {"name": "llama3.1:8b", "size": 4000000000},
-                    {"name": "mistral:7b", "size": 3500000000},
-                ]
-            }
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-            
-            client = OllamaClient("http://localhost:11434")
-            models = client.list_models()
-            
-            assert len(models) == 2
-            assert models[0].name == "llama3.1:8b"
-            assert models[0].size == 4000000000
-            assert models[1].name == "mistral:7b"
+        client = OllamaClient(
+            "http://localhost:11434", client=_StubClient(_MODELS_TWO)
+        )
+        
+        models = client.list_models()
+        
+        assert len(models) == 2
+        assert models[0].name == "llama3.1:8b"
+        assert models[0].size == 4000000000
+        assert models[1].name == "mistral:7b"
     
     def test_list_models_empty(self) -> None:
-        """Test listing models returns empty list when no models."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"models": []}
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-            
-            client = OllamaClient("http://localhost:11434")
-            models = client.list_models()
-            
-            assert len(models) == 0
+        """Test listing models returns empty tuple when no models."""
+        stub = _StubClient({"models": []})
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        assert len(client.list_models()) == 0
     
     def test_list_models_connection_error(self) -> None:
         """Test listing models raises error on connection failure."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
-            
-            client = OllamaClient("http://localhost:11434")
-            
-            with pytest.raises(OllamaConnectionError, match="Failed to connect"):
-                client.list_models()
+        stub = _StubClient(httpx.ConnectError("Connection refused"))
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        with pytest.raises(OllamaConnectionError, match=_ERR_CONNECT):
+            client.list_models()
+    
+    def test_list_models_cached_within_ttl(self) -> None:
+        """Test repeated listings reuse the cached result."""
+        stub = _StubClient(_MODELS_ONE_MISTRAL)
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        first = client.list_models()
+        second = client.list_models()
+        
+        assert first == second
+        assert len(stub.get_calls) == 1
+    
+    def test_invalidate_models_cache_refetches(self) -> None:
+        """Test invalidation forces the next listing to hit Ollama."""
+        stub = _StubClient(_MODELS_ONE_MISTRAL, _MODELS_TWO)
+        client = OllamaClient("http://localhost:11434", client=stub)
+        client.list_models()
+        
+        client.invalidate_models_cache()
+        
+        assert len(client.list_models()) == 2
+        assert len(stub.get_calls) == 2
 
 
 class TestOllamaClientCheckModelAvailable:
     """Tests for OllamaClient.check_model_available method."""
     
     def test_check_model_available_found(self) -> None:
-        """Test model availability returns True when model exists."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "models": [
-                    {"name": "llama3.1:8b", "size": 4000000000},
-                ]
-            }
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+        """Test model availability returns True when /api/show finds it."""
+        with patch.object(httpx.Client, "post") as mock_post:
+            mock_post.return_value = _response(200)
             
             client = OllamaClient("http://localhost:11434")
             result = client.check_model_available("llama3.1:8b")
             
             assert result is True
+            mock_post.assert_called_once_with(
+                "http://localhost:11434/api/show",
+                json={"name": "llama3.1:8b"}
+            )
     
     def test_check_model_available_not_found(self) -> None:
-        """Test model availability returns False when model missing."""
-        with patch.object(httpx.Client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "models": [
-                    {"name": "mistral:7b", "size": 3500000000},
-                ]
-            }
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+        """Test model availability returns False when /api/show 404s."""
+        with patch.object(httpx.Client, "post") as mock_post:
+            mock_post.return_value = _response(
+                404, text='{"error":"model \'llama3.1:8b\' not found"}'
+            )
             
             client = OllamaClient("http://localhost:11434")
             result = client.check_model_available("llama3.1:8b")
             
             assert result is False
+    
+    def test_check_model_available_falls_back_to_tags(self) -> None:
+        """Test servers without /api/show fall back to the tag listing."""
+        stub = _StubClient(_MODELS_ONE_MISTRAL, post=(_response(405),))
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        assert client.check_model_available("mistral:7b") is True
+        assert client.check_model_available("llama3.1:8b") is False
+        # Second check is answered from the cached listing
+        assert len(stub.post_calls) == 1
+        assert len(stub.get_calls) == 1
+    
+    def test_route_missing_404_falls_back_to_tags(self) -> None:
+        """Test a server without /api/show is not read as "model absent"."""
+        stub = _StubClient(
+            _MODELS_ONE_MISTRAL,
+            post=(_response(404, text="404 page not found"),),
+        )
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        assert client.check_model_available("mistral:7b") is True
+        assert len(stub.get_calls) == 1
+    
+    def test_cached_listing_resolves_untagged_name(self) -> None:
+        """Test an untagged name matches its ":latest" tag like /api/show."""
+        stub = _StubClient(
+            {"models": [{"name": "llama3.1:latest", "size": 1}]},
+            post=(_response(405),),
+        )
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        assert client.check_model_available("llama3.1") is True
+        assert client.check_model_available("llama3.1:latest") is True
+        assert client.check_model_available("llama3.1:8b") is False
+    
+    def test_show_request_error_is_logged_before_fallback(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a failed /api/show is logged, then the listing answers."""
+        stub = _StubClient(
+            _MODELS_ONE_MISTRAL,
+            post=(httpx.ConnectError("Connection reset"),),
+        )
+        client = OllamaClient("http://localhost:11434", client=stub)
+        
+        with caplog.at_level("WARNING"):
+            assert client.check_model_available("mistral:7b") is True
+        
+        assert "falling back to model listing" in caplog.text
 
 
 class TestOllamaClientContextManager:
     """Tests for OllamaClient context manager."""
     
+    def test_injected_client_left_open(self) -> None:
+        """Test that an injected HTTP client is not closed by OllamaClient."""
+        stub = MagicMock(spec=httpx.Client)
+        
+        with OllamaClient("http://localhost:11434", client=stub):
+            pass
+        
+        stub.close.assert_not_called()
+    
     def test_context_manager_closes_client(self) -> None:
         """Test that context manager closes the HTTP client."""
         with patch.object(httpx.Client, "close") as mock_close:
@@ -151,3 +248,75 @@ class TestOllamaClientContextManager:
                 pass
             
             mock_close.assert_called_once()
+
+
+class TestAsyncOllamaClient:
+    """Tests for AsyncOllamaClient."""
+    
+    def test_check_models_available_uses_one_listing(self) -> None:
+        """Test batch availability check fetches the model list once."""
+        mock_response = _response(payload=_MODELS_ONE_MISTRAL)
+        
+        async def run() -> dict[str, bool]:
+            async with AsyncOllamaClient("http://localhost:11434") as client:
+                return await client.check_models_available(
+                    ["llama3.1:8b", "mistral:7b"]
+                )
+        
+        with patch.object(
+            httpx.AsyncClient, "get", new=AsyncMock(return_value=mock_response)
+        ) as mock_get:
+            result = asyncio.run(run())
+        
+        assert result == {"llama3.1:8b": False, "mistral:7b": True}
+        mock_get.assert_awaited_once()
+    
+    def test_injected_client_used_and_left_open(self) -> None:
+        """Test that an injected AsyncClient serves requests and stays open."""
+        stub = AsyncMock(spec=httpx.AsyncClient)
+        stub.get.return_value = _response(payload=_MODELS_ONE_MISTRAL)
+        
+        async def run() -> tuple[OllamaModel, ...]:
+            async with AsyncOllamaClient(
+                "http://localhost:11434", client=stub
+            ) as client:
+                return await client.list_models()
+        
+        models = asyncio.run(run())
+        
+        assert [m.name for m in models] == ["mistral:7b"]
+        stub.get.assert_awaited_once_with("http://localhost:11434/api/tags")
+        stub.aclose.assert_not_awaited()
+    
+    def test_list_models_connection_error(self) -> None:
+        """Test a refused connection raises the sync client's error."""
+        error = httpx.ConnectError("Connection refused")
+        stub = AsyncMock(spec=httpx.AsyncClient)
+        stub.get.side_effect = error
+        client = AsyncOllamaClient("http://localhost:11434", client=stub)
+        
+        with pytest.raises(OllamaConnectionError, match=_ERR_CONNECT):
+            asyncio.run(client.list_models())
+    
+    def test_health_check_all_preserves_order(self) -> None:
+        """Test concurrent health checks return results in client order."""
+        ok = _response(200)
+        failed = _response(500)
+        
+        async def run() -> list[bool]:
+            clients = [
+                AsyncOllamaClient("http://host-a:11434"),
+                AsyncOllamaClient("http://host-b:11434"),
+            ]
+            try:
+                return await health_check_all(clients)
+            finally:
+                for client in clients:
+                    await client.aclose()
+        
+        with patch.object(
+            httpx.AsyncClient, "get", new=AsyncMock(side_effect=[ok, failed])
+        ):
+            result = asyncio.run(run())
+        
+        assert result == [True, False]
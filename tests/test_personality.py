@@ -1,5 +1,8 @@
 """Tests for personality module."""
 
+import copy
+from dataclasses import asdict, fields
+
 import pytest
 
 from ai_hunger_games.agents.personality import (
@@ -11,61 +14,36 @@ from ai_hunger_games.agents.personality import (
 )
 
 
-class TestCommunicationStyle:
-    """Tests for CommunicationStyle enum."""
-    
-    def test_all_values_exist(self) -> None:
-        """Test that all expected communication styles exist."""
-        assert CommunicationStyle.CONCISE.value == "concise"
-        assert CommunicationStyle.VERBOSE.value == "verbose"
-        assert CommunicationStyle.RHETORICAL.value == "rhetorical"
-        assert CommunicationStyle.ANALYTICAL.value == "analytical"
-    
-    def test_enum_count(self) -> None:
-        """Test that there are exactly 4 communication styles."""
-        assert len(CommunicationStyle) == 4
-
-
-class TestEthicalStance:
-    """Tests for EthicalStance enum."""
-    
-    def test_all_values_exist(self) -> None:
-        """Test that all expected ethical stances exist."""
-        assert EthicalStance.STRICT.value == "strict"
-        assert EthicalStance.FLEXIBLE.value == "flexible"
-        assert EthicalStance.AMORAL.value == "amoral"
-    
-    def test_enum_count(self) -> None:
-        """Test that there are exactly 3 ethical stances."""
-        assert len(EthicalStance) == 3
-
-
-class TestSocialStrategy:
-    """Tests for SocialStrategy enum."""
-    
-    def test_all_values_exist(self) -> None:
-        """Test that all expected social strategies exist."""
-        assert SocialStrategy.COOPERATIVE.value == "cooperative"
-        assert SocialStrategy.OPPORTUNISTIC.value == "opportunistic"
-        assert SocialStrategy.ADVERSARIAL.value == "adversarial"
-    
-    def test_enum_count(self) -> None:
-        """Test that there are exactly 3 social strategies."""
-        assert len(SocialStrategy) == 3
-
-
-class TestRiskTolerance:
-    """Tests for RiskTolerance enum."""
-    
-    def test_all_values_exist(self) -> None:
-        """Test that all expected risk tolerances exist."""
-        assert RiskTolerance.LOW.value == "low"
-        assert RiskTolerance.MEDIUM.value == "medium"
-        assert RiskTolerance.HIGH.value == "high"
-    
-    def test_enum_count(self) -> None:
-        """Test that there are exactly 3 risk tolerance levels."""
-        assert len(RiskTolerance) == 3
+@pytest.mark.parametrize(
+    ("enum_cls", "expected"),
+    [
+        (CommunicationStyle, {
+            "CONCISE": "concise",
+            "VERBOSE": "verbose",
+            "RHETORICAL": "rhetorical",
+            "ANALYTICAL": "analytical",
+        }),
+        (EthicalStance, {
+            "STRICT": "strict",
+            "FLEXIBLE": "flexible",
+            "AMORAL": "amoral",
+        }),
+        (SocialStrategy, {
+            "COOPERATIVE": "cooperative",
+            "OPPORTUNISTIC": "opportunistic",
+            "ADVERSARIAL": "adversarial",
+        }),
+        (RiskTolerance, {
+            "LOW": "low",
+            "MEDIUM": "medium",
+            "HIGH": "high",
+        }),
+    ],
+    ids=["CommunicationStyle", "EthicalStance", "SocialStrategy", "RiskTolerance"],
+)
+def test_trait_enum_members(enum_cls: type, expected: dict[str, str]) -> None:
+    """Test that each trait enum has exactly the expected members."""
+    assert {member.name: member.value for member in enum_cls} == expected
 
 
 class TestPersonality:
@@ -134,3 +112,74 @@ class TestPersonality:
         assert "amoral" in description
         assert "adversarial" in description
         assert "high" in description
+    
+    def test_to_dict_returns_independent_copy(self) -> None:
+        """Test that mutating to_dict output does not affect later calls."""
+        personality = Personality(
+            communication_style=CommunicationStyle.CONCISE,
+            ethical_stance=EthicalStance.STRICT,
+            social_strategy=SocialStrategy.COOPERATIVE,
+            risk_tolerance=RiskTolerance.LOW,
+            seed=42
+        )
+        
+        first = personality.to_dict()
+        first["seed"] = "tampered"
+        
+        assert personality.to_dict()["seed"] == "42"
+    
+    def test_equal_personalities_share_hash(self) -> None:
+        """Test that the cached hash is consistent with equality."""
+        kwargs = dict(
+            communication_style=CommunicationStyle.CONCISE,
+            ethical_stance=EthicalStance.STRICT,
+            social_strategy=SocialStrategy.COOPERATIVE,
+            risk_tolerance=RiskTolerance.LOW,
+        )
+        
+        p1 = Personality(seed=42, **kwargs)
+        p2 = Personality(seed=42, **kwargs)
+        p3 = Personality(seed=43, **kwargs)
+        
+        assert p1 == p2
+        assert p1 != p3
+        assert p1 != "not a personality"
+        assert hash(p1) == hash(p2)
+        assert len({p1, p2, p3}) == 2
+    
+    def test_caches_are_not_dataclass_fields(self) -> None:
+        """Test that computed forms stay out of fields() and asdict()."""
+        personality = Personality(
+            communication_style=CommunicationStyle.CONCISE,
+            ethical_stance=EthicalStance.STRICT,
+            social_strategy=SocialStrategy.COOPERATIVE,
+            risk_tolerance=RiskTolerance.LOW,
+            seed=42
+        )
+        personality.describe()
+        
+        names = [f.name for f in fields(personality)]
+        
+        assert names == [
+            "communication_style",
+            "ethical_stance",
+            "social_strategy",
+            "risk_tolerance",
+            "seed",
+        ]
+        assert set(asdict(personality)) == set(names)
+    
+    def test_copy_recomputes_cached_forms(self) -> None:
+        """Test that a copy, which skips __init__, still hashes and describes."""
+        personality = Personality(
+            communication_style=CommunicationStyle.CONCISE,
+            ethical_stance=EthicalStance.STRICT,
+            social_strategy=SocialStrategy.COOPERATIVE,
+            risk_tolerance=RiskTolerance.LOW,
+            seed=42
+        )
+        
+        duplicate = copy.copy(personality)
+        
+        assert hash(duplicate) == hash(personality)
+        assert duplicate.describe() == personality.describe()
@@ -12,6 +12,31 @@ from ai_hunger_games.agents.personality import (
 from ai_hunger_games.evolution.personality_generator import PersonalityGenerator
 
 
+@pytest.mark.parametrize(
+    ("seed_a", "agent_a", "seed_b", "agent_b", "same"),
+    [
+        (42, None, 42, None, True),
+        (42, None, 99, None, False),
+        (42, "agent_1", 42, "agent_2", False),
+    ],
+    ids=["same_seed", "different_seeds", "different_agent_ids"],
+)
+def test_seed_invariants(
+    seed_a: int,
+    agent_a: str | None,
+    seed_b: int,
+    agent_b: str | None,
+    same: bool
+) -> None:
+    """Test that fresh generators agree exactly when their inputs do."""
+    p1 = PersonalityGenerator(base_seed=seed_a).generate(agent_id=agent_a)
+    p2 = PersonalityGenerator(base_seed=seed_b).generate(agent_id=agent_b)
+    
+    # Equality covers all four traits and the seed
+    assert (p1 == p2) is same
+    assert (p1.seed == p2.seed) is same
+
+
 class TestPersonalityGenerator:
     """Tests for PersonalityGenerator class."""
     
@@ -28,31 +53,6 @@ class TestPersonalityGenerator:
         assert isinstance(personality.risk_tolerance, RiskTolerance)
         assert personality.seed > 0
     
-    def test_deterministic_generation(self) -> None:
-        """Test that same seed produces same personality."""
-        gen1 = PersonalityGenerator(base_seed=42)
-        gen2 = PersonalityGenerator(base_seed=42)
-        
-        p1 = gen1.generate()
-        p2 = gen2.generate()
-        
-        assert p1.communication_style == p2.communication_style
-        assert p1.ethical_stance == p2.ethical_stance
-        assert p1.social_strategy == p2.social_strategy
-        assert p1.risk_tolerance == p2.risk_tolerance
-        assert p1.seed == p2.seed
-    
-    def test_different_seeds_produce_different_personalities(self) -> None:
-        """Test that different seeds produce different personalities."""
-        gen1 = PersonalityGenerator(base_seed=42)
-        gen2 = PersonalityGenerator(base_seed=99)
-        
-        p1 = gen1.generate()
-        p2 = gen2.generate()
-        
-        # Very unlikely to be identical with 4 independent traits
-        assert p1.seed != p2.seed
-    
     def test_multiple_generations_are_unique(self) -> None:
         """Test that multiple generations from same generator differ."""
         generator = PersonalityGenerator(base_seed=42)
@@ -66,18 +66,14 @@ class TestPersonalityGenerator:
         assert p2.seed != p3.seed
         assert p1.seed != p3.seed
     
-    def test_agent_id_affects_seed(self) -> None:
-        """Test that agent_id parameter affects personality seed."""
+    def test_agent_id_seed_is_stable_across_runs(self) -> None:
+        """Test that agent_id seeding does not depend on hash salting."""
         generator = PersonalityGenerator(base_seed=42)
         
-        p1 = generator.generate(agent_id="agent_1")
+        personality = generator.generate(agent_id="agent_1")
         
-        # Reset generator
-        generator = PersonalityGenerator(base_seed=42)
-        p2 = generator.generate(agent_id="agent_2")
-        
-        # Different agent IDs should produce different seeds
-        assert p1.seed != p2.seed
+        # Pinned value: must not change with PYTHONHASHSEED
+        assert personality.seed == 1130311949043929867
     
     def test_generate_without_agent_id(self) -> None:
         """Test generating without specifying agent_id."""
@@ -88,11 +84,20 @@ class TestPersonalityGenerator:
         assert isinstance(personality, Personality)
         assert personality.seed > 0
     
+    def test_generate_many_matches_sequential_generation(self) -> None:
+        """Test that batch generation equals repeated generate() calls."""
+        batch = PersonalityGenerator(base_seed=42).generate_many(5)
+        
+        generator = PersonalityGenerator(base_seed=42)
+        sequential = [generator.generate() for _ in range(5)]
+        
+        assert batch == sequential
+    
     def test_high_variation(self) -> None:
         """Test that generator produces varied personalities."""
         generator = PersonalityGenerator(base_seed=42)
         
-        personalities = [generator.generate() for _ in range(20)]
+        personalities = generator.generate_many(20)
         
         # Check we get different communication styles
         styles = {p.communication_style for p in personalities}
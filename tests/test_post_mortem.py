@@ -1,29 +1,13 @@
 """Tests for post-mortem module."""
 
+from dataclasses import fields
+
 import pytest
 
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.evolution.post_mortem import PostMortemRecord
 
 
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
-
-
 class TestPostMortemRecord:
     """Tests for PostMortemRecord dataclass."""
     
@@ -59,6 +43,27 @@ class TestPostMortemRecord:
         with pytest.raises(AttributeError):
             record.rounds_survived = 10
     
+    def test_equal_records_share_hash(
+        self, sample_personality: Personality
+    ) -> None:
+        """Test that the cached hash is consistent with equality."""
+        kwargs = dict(
+            agent_id="agent_1",
+            personality=sample_personality,
+            rounds_survived=5,
+            total_votes_received=10,
+            elimination_round=5,
+        )
+        
+        r1 = PostMortemRecord(was_tie=False, **kwargs)
+        r2 = PostMortemRecord(was_tie=False, **kwargs)
+        r3 = PostMortemRecord(was_tie=True, **kwargs)
+        
+        assert r1 == r2
+        assert hash(r1) == hash(r2)
+        assert len({r1, r2, r3}) == 2
+        assert "_hash" not in {f.name for f in fields(r1)}
+    
     def test_to_dict(self, sample_personality: Personality) -> None:
         """Test converting post-mortem to dictionary."""
         record = PostMortemRecord(
@@ -70,15 +75,14 @@ class TestPostMortemRecord:
             was_tie=True
         )
         
-        result = record.to_dict()
-        
-        assert result["agent_id"] == "agent_1"
-        assert result["rounds_survived"] == 5
-        assert result["total_votes_received"] == 10
-        assert result["elimination_round"] == 5
-        assert result["was_tie"] is True
-        assert "personality" in result
-        assert isinstance(result["personality"], dict)
+        assert record.to_dict() == {
+            "agent_id": "agent_1",
+            "personality": sample_personality.to_dict(),
+            "rounds_survived": 5,
+            "total_votes_received": 10,
+            "elimination_round": 5,
+            "was_tie": True,
+        }
     
     def test_personality_in_dict(self, sample_personality: Personality) -> None:
         """Test that personality is properly serialized in dict."""
@@ -91,10 +95,10 @@ class TestPostMortemRecord:
             was_tie=False
         )
         
-        result = record.to_dict()
-        personality_dict = result["personality"]
-        
-        assert personality_dict["communication_style"] == "concise"
-        assert personality_dict["ethical_stance"] == "strict"
-        assert personality_dict["social_strategy"] == "cooperative"
-        assert personality_dict["risk_tolerance"] == "low"
+        assert record.to_dict()["personality"] == {
+            "communication_style": "concise",
+            "ethical_stance": "strict",
+            "social_strategy": "cooperative",
+            "risk_tolerance": "low",
+            "seed": "42",
+        }
@@ -3,13 +3,7 @@
 import pytest
 
 from ai_hunger_games.agents.agent import Agent
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.agents.registry import (
     AgentNotFoundError,
     AgentRegistry,
@@ -17,18 +11,6 @@ from ai_hunger_games.agents.registry import (
 )
 
 
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
-
-
 @pytest.fixture
 def sample_agent(sample_personality: Personality) -> Agent:
     """Create a sample agent for testing."""
@@ -67,6 +49,29 @@ class TestAgentRegistry:
         with pytest.raises(DuplicateAgentError):
             registry.register(agent2)
     
+    def test_register_many_rejects_duplicates_atomically(
+        self, sample_personality: Personality
+    ) -> None:
+        """Test that a batch with a duplicate ID registers nothing."""
+        registry = AgentRegistry()
+        registry.register(
+            Agent(agent_id="agent_1", personality=sample_personality)
+        )
+        
+        with pytest.raises(DuplicateAgentError):
+            registry.register_many([
+                Agent(agent_id="agent_2", personality=sample_personality),
+                Agent(agent_id="agent_1", personality=sample_personality),
+            ])
+        
+        with pytest.raises(DuplicateAgentError):
+            registry.register_many([
+                Agent(agent_id="agent_3", personality=sample_personality),
+                Agent(agent_id="agent_3", personality=sample_personality),
+            ])
+        
+        assert registry.get_ids() == ["agent_1"]
+    
     def test_get_agent(self, sample_agent: Agent) -> None:
         """Test getting an agent by ID."""
         registry = AgentRegistry()
@@ -87,30 +92,30 @@ class TestAgentRegistry:
         """Test getting all agents."""
         registry = AgentRegistry()
         
-        agents = [
+        registry.register_many(
             Agent(agent_id=f"agent_{i}", personality=sample_personality)
             for i in range(3)
-        ]
-        
-        for agent in agents:
-            registry.register(agent)
+        )
         
         all_agents = registry.get_all()
         
         assert len(all_agents) == 3
-        assert all_agents[0].agent_id == "agent_0"
+        assert {agent.agent_id for agent in all_agents} == {
+            "agent_0", "agent_1", "agent_2"
+        }
     
     def test_get_ids(self, sample_personality: Personality) -> None:
         """Test getting all agent IDs."""
         registry = AgentRegistry()
         
-        for i in range(3):
-            agent = Agent(agent_id=f"agent_{i}", personality=sample_personality)
-            registry.register(agent)
+        registry.register_many(
+            Agent(agent_id=f"agent_{i}", personality=sample_personality)
+            for i in range(3)
+        )
         
         ids = registry.get_ids()
         
-        assert ids == ["agent_0", "agent_1", "agent_2"]
+        assert set(ids) == {"agent_0", "agent_1", "agent_2"}
     
     def test_remove_agent(self, sample_agent: Agent) -> None:
         """Test removing an agent."""
@@ -134,9 +139,10 @@ class TestAgentRegistry:
         """Test clearing all agents."""
         registry = AgentRegistry()
         
-        for i in range(3):
-            agent = Agent(agent_id=f"agent_{i}", personality=sample_personality)
-            registry.register(agent)
+        registry.register_many(
+            Agent(agent_id=f"agent_{i}", personality=sample_personality)
+            for i in range(3)
+        )
         
         registry.clear()
         
@@ -146,13 +152,33 @@ class TestAgentRegistry:
         """Test iterating over registry."""
         registry = AgentRegistry()
         
-        for i in range(3):
-            agent = Agent(agent_id=f"agent_{i}", personality=sample_personality)
-            registry.register(agent)
+        registry.register_many(
+            Agent(agent_id=f"agent_{i}", personality=sample_personality)
+            for i in range(3)
+        )
+        
+        agent_ids = {agent.agent_id for agent in registry}
+        
+        assert agent_ids == {"agent_0", "agent_1", "agent_2"}
+    
+    def test_insertion_order_preserved(
+        self, sample_personality: Personality
+    ) -> None:
+        """Test that agents come back in registration order.
+        
+        The arena relies on this order to emit deterministic logs.
+        """
+        registry = AgentRegistry()
+        expected = ["agent_2", "agent_0", "agent_1"]
         
-        agent_ids = [agent.agent_id for agent in registry]
+        for agent_id in expected:
+            registry.register(
+                Agent(agent_id=agent_id, personality=sample_personality)
+            )
         
-        assert agent_ids == ["agent_0", "agent_1", "agent_2"]
+        assert registry.get_ids() == expected
+        assert [agent.agent_id for agent in registry.get_all()] == expected
+        assert [agent.agent_id for agent in registry] == expected
     
     def test_contains(self, sample_agent: Agent) -> None:
         """Test checking if agent exists."""
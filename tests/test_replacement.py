@@ -3,28 +3,22 @@
 import pytest
 
 from ai_hunger_games.agents.agent import Agent
-from ai_hunger_games.agents.personality import (
-    CommunicationStyle,
-    EthicalStance,
-    Personality,
-    RiskTolerance,
-    SocialStrategy,
-)
+from ai_hunger_games.agents.personality import Personality
 from ai_hunger_games.agents.registry import AgentRegistry
 from ai_hunger_games.evolution.personality_generator import PersonalityGenerator
 from ai_hunger_games.evolution.replacement import AgentReplacementCoordinator
 
 
-@pytest.fixture
-def sample_personality() -> Personality:
-    """Create a sample personality for testing."""
-    return Personality(
-        communication_style=CommunicationStyle.CONCISE,
-        ethical_stance=EthicalStance.STRICT,
-        social_strategy=SocialStrategy.COOPERATIVE,
-        risk_tolerance=RiskTolerance.LOW,
-        seed=42
-    )
+_IDS = ("agent_0", "agent_1", "agent_2")
+
+# The elimination replayed by the single-agent tests below.
+_REPLACE_KWARGS = dict(
+    eliminated_agent_id="agent_1",
+    rounds_survived=5,
+    total_votes_received=10,
+    elimination_round=5,
+    was_tie=False,
+)
 
 
 @pytest.fixture
@@ -62,13 +56,7 @@ class TestAgentReplacementCoordinator:
         old_agent = registry_with_agent.get("agent_1")
         old_personality = old_agent.personality
         
-        new_agent = coordinator.replace_agent(
-            eliminated_agent_id="agent_1",
-            rounds_survived=5,
-            total_votes_received=10,
-            elimination_round=5,
-            was_tie=False
-        )
+        new_agent = coordinator.replace_agent(**_REPLACE_KWARGS)
         
         # New agent should have different personality
         assert new_agent.agent_id == "agent_1"
@@ -89,13 +77,7 @@ class TestAgentReplacementCoordinator:
             generator=generator
         )
         
-        coordinator.replace_agent(
-            eliminated_agent_id="agent_1",
-            rounds_survived=5,
-            total_votes_received=10,
-            elimination_round=5,
-            was_tie=False
-        )
+        coordinator.replace_agent(**_REPLACE_KWARGS)
         
         records = coordinator.get_post_mortem_records()
         
@@ -113,13 +95,10 @@ class TestAgentReplacementCoordinator:
     ) -> None:
         """Test multiple agent replacements."""
         registry = AgentRegistry()
-        
-        for i in range(3):
-            agent = Agent(
-                agent_id=f"agent_{i}",
-                personality=sample_personality
-            )
-            registry.register(agent)
+        registry.register_many(
+            Agent(agent_id=agent_id, personality=sample_personality)
+            for agent_id in _IDS
+        )
         
         coordinator = AgentReplacementCoordinator(
             registry=registry,
@@ -165,13 +144,7 @@ class TestAgentReplacementCoordinator:
             memory_window=10
         )
         
-        new_agent = coordinator.replace_agent(
-            eliminated_agent_id="agent_1",
-            rounds_survived=5,
-            total_votes_received=10,
-            elimination_round=5,
-            was_tie=False
-        )
+        new_agent = coordinator.replace_agent(**_REPLACE_KWARGS)
         
         assert new_agent.memory.window_size == 10
     
@@ -186,13 +159,7 @@ class TestAgentReplacementCoordinator:
             generator=generator
         )
         
-        coordinator.replace_agent(
-            eliminated_agent_id="agent_1",
-            rounds_survived=5,
-            total_votes_received=10,
-            elimination_round=5,
-            was_tie=False
-        )
+        coordinator.replace_agent(**_REPLACE_KWARGS)
         
         records1 = coordinator.get_post_mortem_records()
         records2 = coordinator.get_post_mortem_records()
@@ -201,3 +168,5 @@ class TestAgentReplacementCoordinator:
         assert records1 is not records2
         # But same content
         assert len(records1) == len(records2)
+        
+        assert list(coordinator.iter_post_mortem_records()) == records1
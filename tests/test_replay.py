@@ -1,65 +1,152 @@
 """Tests for replay engine module."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
+try:
+    from orjson import dumps
+except ImportError:  # optional speedup, mirrors observability.logger
+    from json import dumps
+
+from ai_hunger_games.observability import logger as event_logger_module
+from ai_hunger_games.observability import replay as replay_module
+from ai_hunger_games.observability.logger import EventLogger
 from ai_hunger_games.observability.replay import (
     ReplayEngine,
     ReplayInconsistencyError,
 )
 
 
+def _encode(events: list[dict]) -> tuple[str | bytes, ...]:
+    """Serialize events to JSONL lines once, at import time.
+    
+    orjson yields bytes and json yields str; ReplayEngine accepts both.
+    """
+    return tuple(dumps(e) for e in events)
+
+
+_SIMPLE_ROUND_LINES = _encode([
+    {"event_type": "RoundStarted", "data": {"round_number": 1, "prompt": "Test", "timestamp": "2024-01-01T00:00:00"}},
+    {"event_type": "AgentResponded", "data": {"round_number": 1, "agent_id": "agent_1", "response": "Response", "timestamp": "2024-01-01T00:00:01"}},
+    {"event_type": "VoteSummary", "data": {"round_number": 1, "vote_counts": {"agent_1": 0}, "timestamp": "2024-01-01T00:00:02"}},
+])
+
+_ELIMINATION_LINES = _encode([
+    {"event_type": "RoundStarted", "data": {"round_number": 1, "prompt": "Test", "timestamp": "2024-01-01T00:00:00"}},
+    {"event_type": "VoteSummary", "data": {"round_number": 1, "vote_counts": {"agent_1": 5}, "timestamp": "2024-01-01T00:00:01"}},
+    {"event_type": "EliminationDecided", "data": {"round_number": 1, "eliminated_agent_id": "agent_1", "cumulative_votes": 5, "was_tie": False, "timestamp": "2024-01-01T00:00:02"}},
+])
+
+# Vote before round start - inconsistent
+_VOTE_BEFORE_ROUND_LINES = _encode([
+    {"event_type": "VoteCast", "data": {"round_number": 1, "voter_id": "agent_1", "voted_for_id": "agent_2", "timestamp": "2024-01-01T00:00:00"}},
+])
+
+
 class TestReplayEngine:
     """Tests for ReplayEngine class."""
     
     def test_replay_simple_round(self) -> None:
         """Test replaying a simple round."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            
-            # Write mock events
-            events = [
-                {"event_type": "RoundStarted", "data": {"round_number": 1, "prompt": "Test", "timestamp": "2024-01-01T00:00:00"}},
-                {"event_type": "AgentResponded", "data": {"round_number": 1, "agent_id": "agent_1", "response": "Response", "timestamp": "2024-01-01T00:00:01"}},
-                {"event_type": "VoteSummary", "data": {"round_number": 1, "vote_counts": {"agent_1": 0}, "timestamp": "2024-01-01T00:00:02"}},
-            ]
-            
-            with log_file.open("w") as f:
-                for event in events:
-                    f.write(json.dumps(event) + "\n")
-            
-            engine = ReplayEngine(str(log_file))
-            summaries = engine.replay()
-            
-            assert len(summaries) == 1
-            assert summaries[0].round_number == 1
-            assert summaries[0].prompt == "Test"
-            assert summaries[0].num_responses == 1
+        engine = ReplayEngine.from_lines(_SIMPLE_ROUND_LINES)
+        summaries = engine.replay()
+        
+        assert len(summaries) == 1
+        assert summaries[0].round_number == 1
+        assert summaries[0].prompt == "Test"
+        assert summaries[0].num_responses == 1
+    
+    def test_constructor_accepts_lines_or_path(self, tmp_path: Path) -> None:
+        """Test both event sources go through the same constructor."""
+        log_file = tmp_path / "events.log"
+        log_file.write_bytes(b"\n".join(
+            line if isinstance(line, bytes) else line.encode("utf-8")
+            for line in _SIMPLE_ROUND_LINES
+        ))
+        
+        from_lines = ReplayEngine(_SIMPLE_ROUND_LINES).replay()
+        
+        assert ReplayEngine.from_lines(_SIMPLE_ROUND_LINES).replay() == from_lines
+        assert ReplayEngine(log_file).replay() == from_lines
     
     def test_replay_with_elimination(self) -> None:
         """Test replaying with elimination."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            
-            events = [
-                {"event_type": "RoundStarted", "data": {"round_number": 1, "prompt": "Test", "timestamp": "2024-01-01T00:00:00"}},
-                {"event_type": "VoteSummary", "data": {"round_number": 1, "vote_counts": {"agent_1": 5}, "timestamp": "2024-01-01T00:00:01"}},
-                {"event_type": "EliminationDecided", "data": {"round_number": 1, "eliminated_agent_id": "agent_1", "cumulative_votes": 5, "was_tie": False, "timestamp": "2024-01-01T00:00:02"}},
-            ]
-            
-            with log_file.open("w") as f:
-                for event in events:
-                    f.write(json.dumps(event) + "\n")
-            
-            engine = ReplayEngine(str(log_file))
-            summaries = engine.replay()
-            
-            assert len(summaries) == 1
-            assert summaries[0].was_elimination_round is True
-            assert summaries[0].eliminated_agent_id == "agent_1"
+        engine = ReplayEngine.from_lines(_ELIMINATION_LINES)
+        summaries = engine.replay()
+        
+        assert len(summaries) == 1
+        assert summaries[0].was_elimination_round is True
+        assert summaries[0].eliminated_agent_id == "agent_1"
+    
+    def test_replay_plain_log_file(self, tmp_path: Path) -> None:
+        """Test that a plain log written by EventLogger replays from disk."""
+        log_file = tmp_path / "events.log"
+        
+        with EventLogger(str(log_file)) as logger:
+            logger.log_round_started(round_number=1, prompt="Test")
+        
+        summaries = ReplayEngine(str(log_file)).replay()
+        
+        assert [s.round_number for s in summaries] == [1]
+    
+    def test_replay_gzip_log_round_trip(self, tmp_path: Path) -> None:
+        """Test that a .gz log written by EventLogger replays the same."""
+        log_file = tmp_path / "events.log.gz"
+        
+        with EventLogger(str(log_file), flush_every=10) as logger:
+            logger.log_round_started(round_number=1, prompt="Test")
+            logger.log_vote_cast_bulk(
+                round_number=1,
+                votes=[("agent_1", "agent_2"), ("agent_2", "agent_1")]
+            )
+        
+        summaries = ReplayEngine(str(log_file)).replay()
+        
+        assert len(summaries) == 1
+        assert summaries[0].num_votes == 2
+    
+    def test_replay_gzip_log_without_trailer(self, tmp_path: Path) -> None:
+        """Test that a .gz log cut off before close() still replays."""
+        log_file = tmp_path / "events.log.gz"
+        cut_off = tmp_path / "cut_off.log.gz"
+        
+        with EventLogger(str(log_file)) as logger:
+            logger.log_round_started(round_number=1, prompt="Test")
+            logger.log_vote_cast_bulk(
+                round_number=1,
+                votes=[("agent_1", "agent_2"), ("agent_2", "agent_1")]
+            )
+            # Snapshot the file as a crash would leave it: no trailer
+            cut_off.write_bytes(log_file.read_bytes())
+        
+        summaries = ReplayEngine(str(cut_off)).replay()
+        
+        assert len(summaries) == 1
+        assert summaries[0].num_votes == 2
+    
+    def test_replay_round_trip_without_orjson(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the stdlib json fallback writes logs replay can read."""
+        monkeypatch.setattr(event_logger_module, "orjson", None)
+        monkeypatch.setattr(replay_module, "_loads", json.loads)
+        log_file = tmp_path / "events.log"
+        
+        with EventLogger(str(log_file)) as logger:
+            logger.log_round_started(round_number=1, prompt="Tést")
+            logger.log_vote_cast_bulk(
+                round_number=1,
+                votes=[("agent_1", "agent_2"), ("agent_2", "agent_1")]
+            )
+        
+        summaries = ReplayEngine(str(log_file)).replay()
+        
+        assert summaries[0].prompt == "Tést"
+        assert summaries[0].num_votes == 2
     
     def test_replay_nonexistent_file_raises(self) -> None:
         """Test that replaying nonexistent file raises."""
@@ -68,19 +155,7 @@ class TestReplayEngine:
     
     def test_replay_inconsistent_logs_raises(self) -> None:
         """Test that inconsistent logs raise error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            
-            # Vote before round start - inconsistent
-            events = [
-                {"event_type": "VoteCast", "data": {"round_number": 1, "voter_id": "agent_1", "voted_for_id": "agent_2", "timestamp": "2024-01-01T00:00:00"}},
-            ]
-            
-            with log_file.open("w") as f:
-                for event in events:
-                    f.write(json.dumps(event) + "\n")
-            
-            engine = ReplayEngine(str(log_file))
-            
-            with pytest.raises(ReplayInconsistencyError):
-                engine.replay()
+        engine = ReplayEngine.from_lines(_VOTE_BEFORE_ROUND_LINES)
+        
+        with pytest.raises(ReplayInconsistencyError):
+            engine.replay()
@@ -1,86 +1,112 @@
 """Tests for vote aggregation module."""
 
-from ai_hunger_games.voting.aggregation import aggregate_votes
-from ai_hunger_games.voting.types import Vote
+import random
+
+import pytest
+
+from ai_hunger_games.voting.aggregation import aggregate_votes, tally_votes
+from ai_hunger_games.voting.types import Vote, VoteResult
+
+
+_FOUR_AGENTS = ["agent_1", "agent_2", "agent_3", "agent_4"]
+
+
+@pytest.mark.parametrize(
+    ("votes", "agents", "expected"),
+    [
+        (
+            [
+                Vote("agent_1", "agent_2", 1),
+                Vote("agent_2", "agent_3", 1),
+                Vote("agent_3", "agent_2", 1),
+            ],
+            ["agent_1", "agent_2", "agent_3"],
+            [("agent_1", 0), ("agent_2", 2), ("agent_3", 1)],
+        ),
+        (
+            [Vote("agent_1", "agent_2", 1)],
+            _FOUR_AGENTS,
+            [("agent_1", 0), ("agent_2", 1), ("agent_3", 0), ("agent_4", 0)],
+        ),
+        ([], ["agent_1", "agent_2"], [("agent_1", 0), ("agent_2", 0)]),
+        (
+            [
+                Vote("agent_1", "agent_4", 1),
+                Vote("agent_2", "agent_4", 1),
+                Vote("agent_3", "agent_4", 1),
+            ],
+            _FOUR_AGENTS,
+            [("agent_1", 0), ("agent_2", 0), ("agent_3", 0), ("agent_4", 3)],
+        ),
+        # Agents given out of order; results come back sorted by ID
+        (
+            [Vote("agent_3", "agent_1", 1), Vote("agent_1", "agent_2", 1)],
+            ["agent_3", "agent_1", "agent_2"],
+            [("agent_1", 1), ("agent_2", 1), ("agent_3", 0)],
+        ),
+    ],
+    ids=["simple", "zero_votes", "empty", "all_for_one", "sorted"],
+)
+def test_aggregate_votes(
+    votes: list[Vote],
+    agents: list[str],
+    expected: list[tuple[str, int]]
+) -> None:
+    """Test per-agent counts, zero-vote inclusion and ID ordering."""
+    result = aggregate_votes(votes, 1, agents)
+    
+    assert result.round_number == 1
+    assert len(result.votes) == len(votes)
+    assert [(r.agent_id, r.votes_received) for r in result.results] == expected
+    for agent_id, count in expected:
+        assert result.get_votes_for(agent_id) == count
 
 
 class TestAggregateVotes:
     """Tests for aggregate_votes function."""
     
-    def test_aggregate_simple_votes(self) -> None:
-        """Test aggregating votes with no ties."""
-        votes = [
-            Vote("agent_1", "agent_2", 1),
-            Vote("agent_2", "agent_3", 1),
-            Vote("agent_3", "agent_2", 1),
-        ]
-        
-        result = aggregate_votes(votes, 1, ["agent_1", "agent_2", "agent_3"])
-        
-        assert result.round_number == 1
-        assert len(result.votes) == 3
-        assert len(result.results) == 3
-        
-        # Check vote counts
-        assert result.get_votes_for("agent_1") == 0
-        assert result.get_votes_for("agent_2") == 2
-        assert result.get_votes_for("agent_3") == 1
-    
-    def test_aggregate_with_zero_votes(self) -> None:
-        """Test that agents with zero votes are included."""
-        votes = [
-            Vote("agent_1", "agent_2", 1),
-        ]
+    def test_accepts_agent_id_generator(self) -> None:
+        """Test that agent IDs can be supplied as a one-shot iterable."""
+        votes = [Vote("agent_1", "agent_2", 1)]
         
         result = aggregate_votes(
-            votes,
-            1,
-            ["agent_1", "agent_2", "agent_3", "agent_4"]
+            votes, 1, (agent_id for agent_id in ["agent_1", "agent_2"])
         )
         
-        assert len(result.results) == 4
-        assert result.get_votes_for("agent_1") == 0
         assert result.get_votes_for("agent_2") == 1
-        assert result.get_votes_for("agent_3") == 0
-        assert result.get_votes_for("agent_4") == 0
-    
-    def test_aggregate_empty_votes(self) -> None:
-        """Test aggregating with no votes cast."""
-        result = aggregate_votes([], 1, ["agent_1", "agent_2"])
-        
-        assert len(result.votes) == 0
-        assert len(result.results) == 2
         assert result.get_votes_for("agent_1") == 0
-        assert result.get_votes_for("agent_2") == 0
+
+
+class TestTallyVotes:
+    """Tests for tally_votes function."""
     
-    def test_aggregate_all_vote_for_one(self) -> None:
-        """Test when all agents vote for the same target."""
+    def test_tally_counts_only_voted_agents(self) -> None:
+        """Test that tallies include only agents that received votes."""
         votes = [
-            Vote("agent_1", "agent_4", 1),
-            Vote("agent_2", "agent_4", 1),
-            Vote("agent_3", "agent_4", 1),
+            Vote("agent_1", "agent_3", 1),
+            Vote("agent_2", "agent_3", 1),
+            Vote("agent_3", "agent_1", 1),
         ]
         
-        result = aggregate_votes(
-            votes,
-            1,
-            ["agent_1", "agent_2", "agent_3", "agent_4"]
-        )
+        results = tally_votes(votes)
         
-        assert result.get_votes_for("agent_4") == 3
-        assert result.get_votes_for("agent_1") == 0
-        assert result.get_votes_for("agent_2") == 0
-        assert result.get_votes_for("agent_3") == 0
+        assert results == (
+            VoteResult(agent_id="agent_1", votes_received=1),
+            VoteResult(agent_id="agent_3", votes_received=2),
+        )
     
-    def test_results_are_sorted(self) -> None:
-        """Test that results are sorted by agent_id."""
+    def test_tally_large_round(self) -> None:
+        """Test that a 10k-vote tally conserves every vote."""
+        rng = random.Random(42)
         votes = [
-            Vote("agent_3", "agent_1", 1),
-            Vote("agent_1", "agent_2", 1),
+            Vote(f"voter_{i}", f"agent_{rng.randrange(100)}", 1)
+            for i in range(10_000)
         ]
         
-        result = aggregate_votes(votes, 1, ["agent_3", "agent_1", "agent_2"])
+        results = tally_votes(votes)
         
-        # Results should be sorted alphabetically
-        agent_ids = [r.agent_id for r in result.results]
-        assert agent_ids == sorted(agent_ids)
+        assert sum(r.votes_received for r in results) == 10_000
+        assert len(results) <= 100
+        assert [r.agent_id for r in results] == sorted(
+            r.agent_id for r in results
+        )
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ai_hunger_games.arena.round_state import RoundState
+from ai_hunger_games.arena.round_state import AgentResponse, RoundState
 from ai_hunger_games.voting.strategy import (
     InvalidVoteError,
     SelfVoteError,
@@ -10,23 +10,31 @@ from ai_hunger_games.voting.strategy import (
 )
 
 
+@pytest.fixture(scope="module")
+def three_agent_state() -> RoundState:
+    """A completed three-agent round shared by read-only tests.
+    
+    Module-scoped: collect_votes only reads the round state.
+    """
+    round_state = RoundState(round_number=1, prompt="Test")
+    round_state.add_response("agent_1", "Response 1")
+    round_state.add_response("agent_2", "Response 2")
+    round_state.add_response("agent_3", "Response 3")
+    return round_state
+
+
 class TestCollectVotes:
     """Tests for collect_votes function."""
     
-    def test_collect_valid_votes(self) -> None:
+    def test_collect_valid_votes(self, three_agent_state: RoundState) -> None:
         """Test collecting valid votes."""
-        round_state = RoundState(round_number=1, prompt="Test")
-        round_state.add_response("agent_1", "Response 1")
-        round_state.add_response("agent_2", "Response 2")
-        round_state.add_response("agent_3", "Response 3")
-        
         vote_choices = {
             "agent_1": "agent_2",
             "agent_2": "agent_3",
             "agent_3": "agent_1",
         }
         
-        votes = collect_votes(round_state, vote_choices)
+        votes = collect_votes(three_agent_state, vote_choices)
         
         assert len(votes) == 3
         assert votes[0].voter_id == "agent_1"
@@ -34,33 +42,46 @@ class TestCollectVotes:
         assert votes[1].voter_id == "agent_2"
         assert votes[1].voted_for_id == "agent_3"
     
-    def test_self_vote_raises_error(self) -> None:
+    def test_self_vote_raises_error(
+        self, three_agent_state: RoundState
+    ) -> None:
         """Test that self-voting raises SelfVoteError."""
-        round_state = RoundState(round_number=1, prompt="Test")
-        round_state.add_response("agent_1", "Response 1")
-        round_state.add_response("agent_2", "Response 2")
-        
         vote_choices = {
             "agent_1": "agent_1",  # Self-vote
             "agent_2": "agent_1",
         }
         
         with pytest.raises(SelfVoteError, match="cannot vote for itself"):
-            collect_votes(round_state, vote_choices)
+            collect_votes(three_agent_state, vote_choices)
     
-    def test_invalid_vote_target_raises_error(self) -> None:
+    def test_invalid_vote_target_raises_error(
+        self, three_agent_state: RoundState
+    ) -> None:
         """Test that voting for non-existent agent raises error."""
-        round_state = RoundState(round_number=1, prompt="Test")
-        round_state.add_response("agent_1", "Response 1")
-        round_state.add_response("agent_2", "Response 2")
-        
         vote_choices = {
             "agent_1": "agent_999",  # Non-existent agent
             "agent_2": "agent_1",
         }
         
         with pytest.raises(InvalidVoteError, match="not found in round"):
-            collect_votes(round_state, vote_choices)
+            collect_votes(three_agent_state, vote_choices)
+    
+    def test_round_built_with_responses_accepts_valid_votes(self) -> None:
+        """Test validation against responses passed to the constructor."""
+        round_state = RoundState(
+            round_number=1,
+            prompt="Test",
+            responses=[
+                AgentResponse("agent_1", "Response 1"),
+                AgentResponse("agent_2", "Response 2"),
+            ]
+        )
+        
+        votes = collect_votes(round_state, {"agent_1": "agent_2"})
+        
+        assert [(v.voter_id, v.voted_for_id) for v in votes] == [
+            ("agent_1", "agent_2")
+        ]
     
     def test_empty_votes(self) -> None:
         """Test collecting zero votes."""
@@ -70,3 +91,32 @@ class TestCollectVotes:
         votes = collect_votes(round_state, {})
         
         assert len(votes) == 0
+    
+    def test_invalid_targets_reported_together(self) -> None:
+        """Test that every unknown vote target is named in the error."""
+        round_state = RoundState(round_number=1, prompt="Test")
+        round_state.add_response("agent_1", "Response 1")
+        round_state.add_response("agent_2", "Response 2")
+        
+        vote_choices = {
+            "agent_1": "agent_998",
+            "agent_2": "agent_999",
+        }
+        
+        with pytest.raises(InvalidVoteError) as exc_info:
+            collect_votes(round_state, vote_choices)
+        
+        assert "agent_998" in str(exc_info.value)
+        assert "agent_999" in str(exc_info.value)
+    
+    def test_known_agent_ids_override_round_roster(self) -> None:
+        """Test that a caller-supplied roster is used for validation."""
+        round_state = RoundState(round_number=1, prompt="Test")
+        round_state.add_response("agent_1", "Response 1")
+        
+        with pytest.raises(InvalidVoteError, match="agent_1"):
+            collect_votes(
+                round_state,
+                {"agent_2": "agent_1"},
+                known_agent_ids=frozenset({"agent_2"})
+            )
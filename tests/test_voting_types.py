@@ -1,106 +1,204 @@
 """Tests for voting types module."""
 
+import dataclasses
+from operator import attrgetter
+
 import pytest
 
-from ai_hunger_games.voting.types import Vote, VoteResult, VotingRoundResult
+from ai_hunger_games.voting.types import (
+    Vote,
+    VoteResult,
+    VotingRoundResult,
+    intern_vote,
+)
+
+
+# Pure value-object tests: keep them on one worker under
+# `pytest -n auto --dist loadgroup` so module fixtures are built once.
+pytestmark = pytest.mark.xdist_group(name="voting_types_pure")
+
+
+_ROUND_VOTES = (
+    Vote("agent_1", "agent_2", 1),
+    Vote("agent_2", "agent_3", 1),
+)
+_ROUND_RESULTS = (
+    VoteResult("agent_1", 0),
+    VoteResult("agent_2", 1),
+    VoteResult("agent_3", 1),
+)
+
+
+@pytest.fixture(scope="module")
+def sample_vote() -> Vote:
+    """A canonical vote; module-scoped since Vote is frozen."""
+    return Vote(voter_id="agent_1", voted_for_id="agent_2", round_number=1)
+
+
+@pytest.fixture(scope="module")
+def sample_vote_result() -> VoteResult:
+    """A canonical vote result; module-scoped since it is frozen."""
+    return VoteResult(agent_id="agent_1", votes_received=3)
+
+
+@pytest.fixture(scope="module")
+def sample_round_result() -> VotingRoundResult:
+    """A round with two votes over three agents; frozen, so shared."""
+    return VotingRoundResult(
+        round_number=1,
+        votes=_ROUND_VOTES,
+        results=_ROUND_RESULTS
+    )
+
+
+@pytest.fixture(scope="module")
+def round_result() -> VotingRoundResult:
+    """A three-agent round result shared by read-only lookup tests.
+    
+    Module-scoped: VotingRoundResult is frozen.
+    """
+    return VotingRoundResult(
+        round_number=1,
+        votes=(),
+        results=(
+            VoteResult("agent_1", 0),
+            VoteResult("agent_2", 3),
+            VoteResult("agent_3", 1),
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def big_round_result() -> VotingRoundResult:
+    """A 10,000-agent round where agent a{i} received i votes.
+    
+    Module-scoped: VotingRoundResult is frozen and costly to build.
+    """
+    results = tuple(VoteResult(f"a{i}", i) for i in range(10_000))
+    return VotingRoundResult(round_number=1, votes=(), results=results)
 
 
 class TestVote:
     """Tests for Vote dataclass."""
     
-    def test_create_vote(self) -> None:
+    def test_create_vote(self, sample_vote: Vote) -> None:
         """Test creating a vote."""
-        vote = Vote(
-            voter_id="agent_1",
-            voted_for_id="agent_2",
-            round_number=1
-        )
+        fields = attrgetter("voter_id", "voted_for_id", "round_number")
         
-        assert vote.voter_id == "agent_1"
-        assert vote.voted_for_id == "agent_2"
-        assert vote.round_number == 1
+        assert fields(sample_vote) == ("agent_1", "agent_2", 1)
     
-    def test_vote_is_frozen(self) -> None:
-        """Test that votes cannot be modified."""
-        vote = Vote(
-            voter_id="agent_1",
-            voted_for_id="agent_2",
-            round_number=1
-        )
+    def test_equal_votes_share_hash(self) -> None:
+        """Test that equal votes hash alike, so they can be deduplicated."""
+        assert Vote("a", "b", 1) == Vote("a", "b", 1)
+        assert hash(Vote("a", "b", 1)) == hash(Vote("a", "b", 1))
+    
+    def test_intern_vote_reuses_instances(self) -> None:
+        """Test that interning returns one shared instance per triple."""
+        vote = intern_vote("a", "b", 1)
         
-        with pytest.raises(AttributeError):
-            vote.voter_id = "agent_3"
+        assert intern_vote("a", "b", 1) is vote
+        assert vote == Vote("a", "b", 1)
+        assert intern_vote("a", "b", 2) is not vote
 
 
 class TestVoteResult:
     """Tests for VoteResult dataclass."""
     
-    def test_create_vote_result(self) -> None:
+    def test_create_vote_result(
+        self, sample_vote_result: VoteResult
+    ) -> None:
         """Test creating a vote result."""
-        result = VoteResult(agent_id="agent_1", votes_received=3)
+        fields = attrgetter("agent_id", "votes_received")
         
-        assert result.agent_id == "agent_1"
-        assert result.votes_received == 3
-    
-    def test_vote_result_is_frozen(self) -> None:
-        """Test that vote results cannot be modified."""
-        result = VoteResult(agent_id="agent_1", votes_received=3)
-        
-        with pytest.raises(AttributeError):
-            result.votes_received = 5
+        assert fields(sample_vote_result) == ("agent_1", 3)
 
 
 class TestVotingRoundResult:
     """Tests for VotingRoundResult dataclass."""
     
-    def test_create_voting_round_result(self) -> None:
+    def test_create_voting_round_result(
+        self, sample_round_result: VotingRoundResult
+    ) -> None:
         """Test creating a voting round result."""
-        votes = (
-            Vote("agent_1", "agent_2", 1),
-            Vote("agent_2", "agent_3", 1),
-        )
-        results = (
-            VoteResult("agent_1", 0),
-            VoteResult("agent_2", 1),
-            VoteResult("agent_3", 1),
-        )
-        
-        round_result = VotingRoundResult(
-            round_number=1,
-            votes=votes,
-            results=results
-        )
+        round_result = sample_round_result
         
         assert round_result.round_number == 1
-        assert len(round_result.votes) == 2
-        assert len(round_result.results) == 3
+        # Stored by reference: no defensive copy of the tuples
+        assert round_result.votes is _ROUND_VOTES
+        assert round_result.results is _ROUND_RESULTS
+
+
+@pytest.mark.parametrize(
+    "cls", [Vote, VoteResult, VotingRoundResult], ids=lambda cls: cls.__name__
+)
+def test_declared_frozen(cls: type) -> None:
+    """Test that every voting record type is declared frozen."""
+    assert cls.__dataclass_params__.frozen
+
+
+def test_frozen_assignment_raises(sample_vote: Vote) -> None:
+    """Test that assigning to a frozen record still raises."""
+    with pytest.raises(AttributeError):
+        setattr(sample_vote, "voter_id", "agent_3")
+
+
+@pytest.mark.parametrize(
+    ("cls", "slots"),
+    [
+        (Vote, ("voter_id", "voted_for_id", "round_number")),
+        (VoteResult, ("agent_id", "votes_received")),
+        (VotingRoundResult, ("round_number", "votes", "results")),
+    ],
+    ids=["vote", "vote_result", "voting_round_result"],
+)
+def test_slotted_layout(cls: type, slots: tuple[str, ...]) -> None:
+    """Test that voting records are slotted with no instance __dict__.
     
-    def test_get_votes_for(self) -> None:
-        """Test getting votes for a specific agent."""
-        results = (
-            VoteResult("agent_1", 0),
-            VoteResult("agent_2", 3),
-            VoteResult("agent_3", 1),
-        )
-        
-        round_result = VotingRoundResult(
-            round_number=1,
-            votes=(),
-            results=results
-        )
-        
-        assert round_result.get_votes_for("agent_1") == 0
-        assert round_result.get_votes_for("agent_2") == 3
-        assert round_result.get_votes_for("agent_3") == 1
+    Only real data is a field; VotingRoundResult's lazy agent index is
+    a slot on a private base so fields() and asdict() never see it.
+    """
+    assert cls.__slots__ == slots
+    assert tuple(f.name for f in dataclasses.fields(cls)) == slots
+    assert "__dict__" not in dir(cls)
+
+
+@pytest.mark.parametrize(
+    ("agent_id", "expected"),
+    [("agent_1", 0), ("agent_2", 3), ("agent_3", 1), ("agent_999", 0)],
+)
+def test_get_votes_for(
+    round_result: VotingRoundResult,
+    agent_id: str,
+    expected: int
+) -> None:
+    """Test per-agent lookups, with unknown agents counting as 0."""
+    assert round_result.get_votes_for(agent_id) == expected
+
+
+@pytest.mark.parametrize("index", [0, 1, 500, 9999, -1])
+def test_get_votes_for_large_round(
+    big_round_result: VotingRoundResult,
+    index: int
+) -> None:
+    """Test lookups at both ends of a large round, and a missing agent."""
+    expected = index if index >= 0 else 0
     
-    def test_get_votes_for_nonexistent(self) -> None:
-        """Test getting votes for non-existent agent returns 0."""
-        results = (VoteResult("agent_1", 2),)
-        
-        round_result = VotingRoundResult(
-            round_number=1,
-            votes=(),
-            results=results
-        )
-        
-        assert round_result.get_votes_for("agent_999") == 0
+    assert big_round_result.get_votes_for(f"a{index}") == expected
+
+
+def test_get_votes_for_scales_to_large_rounds(
+    big_round_result: VotingRoundResult
+) -> None:
+    """Test lookups across a large round stay correct and indexed.
+    
+    The agent index must be built once and then reused; rebuilding it
+    or scanning results per lookup would make this 10k x 10k work.
+    """
+    big_round_result.get_votes_for("a0")
+    index = big_round_result._index
+    
+    assert all(
+        big_round_result.get_votes_for(f"a{i}") == i for i in range(10_000)
+    )
+    assert big_round_result._index is index
+    assert len(index) == 10_000